@@ -28,8 +28,17 @@ class BrowserConfig(BaseModel):
 
     headless: bool = Field(default=False)
     timeout: int = Field(default=60000)
+    element_timeout: int = Field(default=3000, ge=0)
+    smart_search_timeout: int = Field(default=5000, ge=0)
     viewport_width: int = Field(default=1280)
     viewport_height: int = Field(default=720)
+    pool_size: int = Field(default=1, gt=0)
+    pool_max_uses: int = Field(default=50, gt=0)
+    cdp_endpoint: str | None = Field(default=None)
+    idle_timeout: int = Field(default=0, ge=0)
+    max_navigations_per_context: int = Field(default=0, ge=0)
+    block_stylesheets: bool = Field(default=False)
+    lightweight_mode: bool = Field(default=False)
 
 
 class SearchConfig(BaseModel):
@@ -92,8 +101,17 @@ class Config(BaseModel):
             browser=BrowserConfig(
                 headless=os.getenv("BROWSER_HEADLESS", "true").lower() == "true",
                 timeout=int(os.getenv("BROWSER_TIMEOUT", "60000")),
+                element_timeout=int(os.getenv("BROWSER_ELEMENT_TIMEOUT", "3000")),
+                smart_search_timeout=int(os.getenv("BROWSER_SMART_SEARCH_TIMEOUT", "5000")),
                 viewport_width=int(os.getenv("BROWSER_VIEWPORT_WIDTH", "1280")),
                 viewport_height=int(os.getenv("BROWSER_VIEWPORT_HEIGHT", "720")),
+                pool_size=int(os.getenv("BROWSER_POOL_SIZE", "1")),
+                pool_max_uses=int(os.getenv("BROWSER_POOL_MAX_USES", "50")),
+                cdp_endpoint=os.getenv("BROWSER_CDP_ENDPOINT") or None,
+                idle_timeout=int(os.getenv("BROWSER_IDLE_TIMEOUT", "0")),
+                max_navigations_per_context=int(os.getenv("BROWSER_MAX_NAVIGATIONS_PER_CONTEXT", "0")),
+                block_stylesheets=os.getenv("BROWSER_BLOCK_STYLESHEETS", "false").lower() == "true",
+                lightweight_mode=os.getenv("BROWSER_LIGHTWEIGHT_MODE", "false").lower() == "true",
             ),
             search=SearchConfig(
                 engine=os.getenv("SEARCH_ENGINE", "duckduckgo"),
@@ -2,6 +2,8 @@
 Custom exceptions for Swarm.
 """
 
+import re
+
 
 class SwarmError(Exception):
     """Base exception for all Swarm errors."""
@@ -183,6 +185,53 @@ EXCEPTION_MAPPING = {
 }
 
 
+def compile_exception_rules(mapping: dict[str, type[SwarmError]]) -> tuple[re.Pattern | None, tuple]:
+    """
+    Compile a keyword -> exception class mapping into a single case-insensitive alternation.
+
+    Args:
+        mapping: Keywords mapped to exception classes, in priority order
+
+    Returns:
+        Tuple of (compiled pattern, exception classes), where capture group N maps to class N - 1
+    """
+    if not mapping:
+        return None, ()
+
+    # Zero-width lookahead so keywords nested inside other keywords (e.g. "search" in "research") still match
+    alternation = "|".join(f"({re.escape(keyword)})" for keyword in mapping)
+    pattern = re.compile(f"(?=(?:{alternation}))", re.IGNORECASE)
+    return pattern, tuple(mapping.values())
+
+
+def match_exception_class(
+    rules: tuple[re.Pattern | None, tuple], *texts: str, default: type[SwarmError] = SwarmError
+) -> type[SwarmError]:
+    """
+    Find the exception class for the highest-priority keyword found in any of the texts.
+
+    Args:
+        rules: Rules built by compile_exception_rules
+        *texts: Texts to scan for keywords
+        default: Class to return when no keyword matches
+
+    Returns:
+        The matching exception class
+    """
+    pattern, classes = rules
+    if pattern is None:
+        return default
+
+    groups = {match.lastindex for text in texts if text for match in pattern.finditer(text)}
+    if not groups:
+        return default
+
+    return classes[min(groups) - 1]
+
+
+_EXCEPTION_RULES = compile_exception_rules(EXCEPTION_MAPPING)
+
+
 def get_appropriate_exception(error_message: str, context: str = "") -> type[SwarmError]:
     """
     Get the most appropriate exception class based on error message and context.
@@ -194,16 +243,7 @@ def get_appropriate_exception(error_message: str, context: str = "") -> type[Swa
     Returns:
         The most appropriate exception class
     """
-    error_lower = error_message.lower()
-    context_lower = context.lower()
-
-    # Check context first for more specific matching
-    for keyword, exception_class in EXCEPTION_MAPPING.items():
-        if keyword in context_lower or keyword in error_lower:
-            return exception_class
-
-    # Default to base SwarmError
-    return SwarmError
+    return match_exception_class(_EXCEPTION_RULES, context, error_message)
 
 
 def create_exception_from_generic(generic_exception: Exception, context: str = "", **kwargs) -> SwarmError:
@@ -5,13 +5,15 @@ This module provides a centralized service container that eliminates
 the need to pass configuration objects deep into the call stack.
 """
 
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 
 from swarm.core.config import Config
 from swarm.llm.client import LLMClient
-from swarm.web.browser import Browser
 from swarm.web.search import WebSearch
 
+if TYPE_CHECKING:
+    from swarm.web.browser import Browser
+
 T = TypeVar("T")
 
 
@@ -38,15 +40,19 @@ class ServiceContainer:
         container._config = config
         container._services = {}
 
-        # Register core services
-        container._services["browser"] = Browser(config.browser)
+        # Register core services; the browser is created on first use so Playwright is only loaded when needed
         container._services["search"] = WebSearch(config.search)
         container._services["llm"] = LLMClient(config.llm)
 
     @classmethod
-    def get_browser(cls) -> Browser:
-        """Get the browser service."""
-        return cls()._services["browser"]
+    def get_browser(cls) -> "Browser":
+        """Get the browser service, creating it on first access."""
+        container = cls()
+        if "browser" not in container._services:
+            from swarm.web.browser import Browser
+
+            container._services["browser"] = Browser(container._config.browser)
+        return container._services["browser"]
 
     @classmethod
     def get_search(cls) -> WebSearch:
@@ -77,8 +83,10 @@ class ServiceMixin:
     without needing config objects passed around.
     """
 
+    __slots__ = ()
+
     @property
-    def browser(self) -> Browser:
+    def browser(self) -> "Browser":
         """Get browser service."""
         return ServiceContainer.get_browser()
 
@@ -157,7 +157,7 @@ class ResearchAssistant(ServiceMixin):
                     )
 
                     if content_data:
-                        # Extract images if enabled
+                        # Extract images if enabled; the page HTML is parsed and dropped right away
                         if self.image_processor:
                             images = await self.image_processor.extract_images(source["url"])
                             content_data["images"] = images
@@ -277,7 +277,7 @@ class ResearchAssistant(ServiceMixin):
 
     async def cleanup(self):
         """Clean up resources."""
-        if hasattr(self.browser, "_session_active") and self.browser._session_active:
+        if self.browser.is_active:
             await self.browser.close_session()
             if self.verbose:
                 console.print("[dim]🧹 Browser session closed[/dim]")
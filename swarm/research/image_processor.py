@@ -2,68 +2,103 @@
 Image Processor - Handles image detection and markdown formatting.
 """
 
+import asyncio
 import re
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
+from bs4 import BeautifulSoup, SoupStrainer
 from rich.console import Console
 
 from swarm.core.services import ServiceMixin
 
 console = Console()
 
+# Precompiled filters used by ImageProcessor._is_content_image
+_SKIP_RE = re.compile(r"icon|logo|button|arrow|pixel|spacer|ads|tracking|analytics|beacon|counter")
+_SMALL_SIZE_RE = re.compile(r"16x16|24x24|32x32|48x48|1x1")
+_SKIP_FILE_RE = re.compile(r"favicon|sprite|thumbnail|avatar")
+_CONTENT_RE = re.compile(r"content|article|photo|image|media|gallery")
+_CONTENT_EXT_RE = re.compile(r"\.(?:jpe?g|png|gif|webp|svg)")
+_SMALL_HINT_RE = re.compile(r"icon|thumb|small")
+
 
 class ImageProcessor(ServiceMixin):
     """Handles image extraction and processing for research."""
 
+    __slots__ = ("verbose",)
+
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
 
-    async def extract_images(self, url: str) -> list[dict[str, str]]:
+    async def extract_images(self, url: str, max_images: int = 5) -> list[dict[str, str]]:
         """
         Extract relevant images from the current page.
 
         Args:
             url: Source URL for the page
+            max_images: Maximum number of images to keep; scanning stops once reached
 
         Returns:
             List of image data with markdown formatting
         """
+        html = await self.capture_page_html()
+        if not html:
+            return []
+
+        return await asyncio.to_thread(self._select_images, html, url, max_images)
+
+    async def capture_page_html(self) -> str:
+        """
+        Capture the rendered HTML of the current page for image extraction.
+
+        Returns:
+            Page HTML, or an empty string if it could not be read
+        """
+        try:
+            # The text extracted by extract_page_content has no markup left, so read the DOM instead
+            return await self.browser.page.content()
+        except Exception as e:
+            if self.verbose:
+                console.print(f"[yellow]⚠️ Image extraction failed: {str(e)}[/yellow]")
+            return ""
+
+    def _select_images(self, html: str, url: str, max_images: int) -> list[dict[str, str]]:
+        """Parse page HTML and collect up to ``max_images`` content images."""
+        if not html or max_images <= 0:
+            return []
+
         try:
-            # Get page content to extract images - use the correct browser method
-            content_result = await self.browser.extract_page_content(max_length=50000)
-
-            if content_result.get("status") != "success":
-                return []
-
-            images = []
-
-            # Look for image elements in the page content
-            content = content_result.get("content", "")
-            if content:
-                # Find image URLs in the page content
-                img_pattern = r'<img[^>]*src=["\']([^"\']+)["\'][^>]*(?:alt=["\']([^"\']*)["\'])?[^>]*>'
-                matches = re.findall(img_pattern, content, re.IGNORECASE)
-
-                for match in matches:
-                    img_url = match[0]
-                    alt_text = match[1] if len(match) > 1 else "Image"
-
-                    # Convert relative URLs to absolute
-                    img_url = self._normalize_url(img_url, url)
-
-                    # Filter for likely content images
-                    if self._is_content_image(img_url, alt_text):
-                        images.append(
-                            {
-                                "url": img_url,
-                                "alt": alt_text,
-                                "markdown": f"![{alt_text}]({img_url})",
-                                "source_page": url,
-                            }
-                        )
-
-            # Limit to 5 images per page to avoid clutter
-            result = images[:5]
+            result = []
+
+            # Resolve the page origin once for root-relative image URLs
+            base = urlsplit(url)
+            base_origin = f"{base.scheme}://{base.netloc}"
+
+            # Only build <img> nodes instead of the whole document tree
+            soup = BeautifulSoup(html, "html.parser", parse_only=SoupStrainer("img"))
+            for node in soup.find_all("img"):
+                img_url = node.get("src")
+                if not img_url:
+                    continue
+                alt_text = node.get("alt") or "Image"
+
+                # Convert relative URLs to absolute
+                img_url = self._normalize_url(img_url, url, base_origin)
+
+                # Filter for likely content images
+                if self._is_content_image(img_url, alt_text):
+                    result.append(
+                        {
+                            "url": img_url,
+                            "alt": alt_text,
+                            "markdown": f"![{alt_text}]({img_url})",
+                            "source_page": url,
+                        }
+                    )
+
+                    # Limit images per page to avoid clutter
+                    if len(result) >= max_images:
+                        break
 
             if result and self.verbose:
                 console.print(f"[dim]🖼️ Found {len(result)} images on page[/dim]")
@@ -75,16 +110,17 @@ class ImageProcessor(ServiceMixin):
                 console.print(f"[yellow]⚠️ Image extraction failed: {str(e)}[/yellow]")
             return []
 
-    def _normalize_url(self, img_url: str, base_url: str) -> str:
+    def _normalize_url(self, img_url: str, base_url: str, base_origin: str | None = None) -> str:
         """Convert relative URLs to absolute URLs."""
-        if img_url.startswith("//"):
+        if img_url.startswith(("http://", "https://")):
+            return img_url
+        elif img_url.startswith("//"):
             return "https:" + img_url
-        elif img_url.startswith("/"):
-            return urljoin(base_url, img_url)
-        elif not img_url.startswith(("http://", "https://")):
-            return urljoin(base_url, img_url)
+        elif img_url.startswith("/") and base_origin:
+            # Root-relative: the origin is enough, no need for a full urljoin
+            return base_origin + img_url
         else:
-            return img_url
+            return urljoin(base_url, img_url)
 
     def _is_content_image(self, img_url: str, alt_text: str) -> bool:
         """
@@ -97,37 +133,14 @@ class ImageProcessor(ServiceMixin):
         Returns:
             True if image appears to be content-relevant
         """
-        # Skip common non-content images
-        skip_patterns = [
-            "icon",
-            "logo",
-            "button",
-            "arrow",
-            "pixel",
-            "spacer",
-            "ads",
-            "tracking",
-            "analytics",
-            "beacon",
-            "counter",
-        ]
-
         img_lower = img_url.lower()
-        alt_lower = alt_text.lower()
 
         # Skip if URL or alt text contains skip patterns
-        for pattern in skip_patterns:
-            if pattern in img_lower or pattern in alt_lower:
-                return False
-
-        # Skip very small likely icon/button images
-        small_sizes = ["16x16", "24x24", "32x32", "48x48", "1x1"]
-        if any(size in img_lower for size in small_sizes):
+        if _SKIP_RE.search(img_lower) or _SKIP_RE.search(alt_text.lower()):
             return False
 
-        # Skip common non-content file patterns
-        skip_files = ["favicon", "sprite", "thumbnail", "avatar"]
-        if any(pattern in img_lower for pattern in skip_files):
+        # Skip very small likely icon/button images and common non-content files
+        if _SMALL_SIZE_RE.search(img_lower) or _SKIP_FILE_RE.search(img_lower):
             return False
 
         # Include if it has descriptive alt text
@@ -135,15 +148,12 @@ class ImageProcessor(ServiceMixin):
             return True
 
         # Include if URL suggests content
-        content_indicators = ["content", "article", "photo", "image", "media", "gallery"]
-        if any(indicator in img_lower for indicator in content_indicators):
+        if _CONTENT_RE.search(img_lower):
             return True
 
         # Include images with common content file extensions
-        content_extensions = [".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg"]
-        if any(ext in img_lower for ext in content_extensions):
-            # But exclude if it's clearly an icon or small image
-            if not any(skip in img_lower for skip in ["icon", "thumb", "small"]):
-                return True
+        # But exclude if it's clearly an icon or small image
+        if _CONTENT_EXT_RE.search(img_lower) and not _SMALL_HINT_RE.search(img_lower):
+            return True
 
         return False
@@ -2,8 +2,17 @@
 Language Support - Handles internationalization for research output.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
+
+def _freeze(tables: dict[str, dict[str, str]]) -> Mapping[str, Mapping[str, str]]:
+    """Wrap a per-language table in read-only mapping proxies."""
+    return MappingProxyType({language: MappingProxyType(table) for language, table in tables.items()})
+
+
 # Language translations for UI elements
-TRANSLATIONS = {
+_TRANSLATION_TABLES = {
     "english": {
         "research_report": "Research Report",
         "generated": "Generated",
@@ -68,8 +77,10 @@ TRANSLATIONS = {
     },
 }
 
+TRANSLATIONS: Mapping[str, Mapping[str, str]] = _freeze(_TRANSLATION_TABLES)
+
 # Language-specific LLM prompts
-LLM_PROMPTS = {
+_PROMPT_TABLES = {
     "english": {
         "source_summary": """
 Summarize key points from this source relevant to "{query}":
@@ -188,23 +199,38 @@ Keep response focused and under 500 words.
     },
 }
 
+LLM_PROMPTS: Mapping[str, Mapping[str, str]] = _freeze(_PROMPT_TABLES)
+
 
 class LanguageHelper:
     """Helper class for multi-language support in research output."""
 
+    __slots__ = ("language", "_translations", "_fallback_translations", "_prompts", "_fallback_prompts")
+
     def __init__(self, language: str = "english"):
         self.language = language.lower()
         if self.language not in TRANSLATIONS:
             self.language = "english"  # Fallback to English
 
+        # Bind the per-language tables once; they never change after construction
+        self._translations = TRANSLATIONS[self.language]
+        self._fallback_translations = TRANSLATIONS["english"]
+        self._prompts = LLM_PROMPTS.get(self.language, LLM_PROMPTS["english"])
+        self._fallback_prompts = LLM_PROMPTS["english"]
+
     def get_text(self, key: str) -> str:
         """Get translated text for a given key."""
-        return TRANSLATIONS[self.language].get(key, TRANSLATIONS["english"].get(key, key))
+        text = self._translations.get(key)
+        if text is None:
+            text = self._fallback_translations.get(key, key)
+        return text
 
     def get_prompt(self, prompt_type: str, **kwargs) -> str:
         """Get language-specific LLM prompt with formatting."""
-        template = LLM_PROMPTS[self.language].get(prompt_type, LLM_PROMPTS["english"].get(prompt_type, ""))
-        return template.format(**kwargs)
+        template = self._prompts.get(prompt_type)
+        if template is None:
+            template = self._fallback_prompts.get(prompt_type, "")
+        return template.format_map(kwargs)
 
     def is_chinese(self) -> bool:
         """Check if current language is Chinese."""
@@ -2,7 +2,29 @@
 Utility functions for Swarm.
 """
 
-from swarm.utils.helpers import extract_domain, sanitize_url
-from swarm.utils.logging import setup_logging
+from importlib import import_module
+from typing import Any
 
 __all__ = ["setup_logging", "sanitize_url", "extract_domain"]
+
+# Public name -> submodule that defines it; imported on first access (PEP 562)
+_LAZY_ATTRS = {
+    "setup_logging": "swarm.utils.logging",
+    "sanitize_url": "swarm.utils.helpers",
+    "extract_domain": "swarm.utils.helpers",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public helpers lazily so importing swarm.utils does not pull in Rich."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -22,47 +22,84 @@ from swarm.core.exceptions import (
     WebContentError,
     WebError,
     WebSearchError,
+    compile_exception_rules,
     create_exception_from_generic,
+    match_exception_class,
 )
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Keyword dispatch rules for the decorators; earlier keywords take priority
+_BROWSER_RULES = compile_exception_rules(
+    {
+        "session": BrowserSessionError,
+        "navigation": BrowserNavigationError,
+        "navigate": BrowserNavigationError,
+        "element": BrowserElementError,
+        "click": BrowserElementError,
+        "fill": BrowserElementError,
+    }
+)
+_WEB_RULES = compile_exception_rules({"search": WebSearchError, "content": WebContentError, "extract": WebContentError})
+_LLM_RULES = compile_exception_rules(
+    {"timeout": LLMTimeoutError, "timed out": LLMTimeoutError, "connect": LLMConnectionError}
+)
+_MCP_RULES = compile_exception_rules({"tool": MCPToolError})
+_RESEARCH_RULES = compile_exception_rules({})
 
-def handle_browser_exceptions(func: Callable[..., T]) -> Callable[..., T]:
-    """
-    Decorator to handle browser-related exceptions consistently.
 
-    Args:
-        func: Function to wrap
+def _translate_exception(exception: Exception, func: Callable, rules: tuple, default: type[SwarmError]) -> SwarmError:
+    """Build the specific SwarmError for a generic exception raised by a decorated function."""
+    message = str(exception)
+    exception_class = match_exception_class(rules, message, default=default)
+    return exception_class(message, details=f"Function: {func.__name__}")
 
-    Returns:
-        Wrapped function with browser exception handling
-    """
+
+def _wrap_sync(func: Callable[..., T], passthrough: type[SwarmError], rules: tuple) -> Callable[..., T]:
+    """Wrap a sync function so generic exceptions become ``passthrough`` or a subclass picked by ``rules``."""
 
     @wraps(func)
     def wrapper(*args, **kwargs) -> T:
         try:
             return func(*args, **kwargs)
-        except (BrowserError, BrowserSessionError, BrowserNavigationError, BrowserElementError):
-            # Re-raise specific browser errors
+        except passthrough:
             raise
         except Exception as e:
-            # Convert generic exceptions to specific browser errors
-            error_msg = str(e).lower()
-            if "session" in error_msg:
-                raise BrowserSessionError(str(e), details=f"Function: {func.__name__}")
-            elif "navigation" in error_msg or "navigate" in error_msg:
-                raise BrowserNavigationError(str(e), details=f"Function: {func.__name__}")
-            elif "element" in error_msg or "click" in error_msg or "fill" in error_msg:
-                raise BrowserElementError(str(e), details=f"Function: {func.__name__}")
-            else:
-                raise BrowserError(str(e), details=f"Function: {func.__name__}")
+            raise _translate_exception(e, func, rules, passthrough)
 
     return wrapper
 
 
+def _wrap_async(func: Callable[..., T], passthrough: type[SwarmError], rules: tuple) -> Callable[..., T]:
+    """Async counterpart of _wrap_sync."""
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs) -> T:
+        try:
+            return await func(*args, **kwargs)
+        except passthrough:
+            raise
+        except Exception as e:
+            raise _translate_exception(e, func, rules, passthrough)
+
+    return wrapper
+
+
+def handle_browser_exceptions(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Decorator to handle browser-related exceptions consistently.
+
+    Args:
+        func: Function to wrap
+
+    Returns:
+        Wrapped function with browser exception handling
+    """
+    return _wrap_sync(func, BrowserError, _BROWSER_RULES)
+
+
 def handle_web_exceptions(func: Callable[..., T]) -> Callable[..., T]:
     """
     Decorator to handle web-related exceptions consistently.
@@ -73,25 +110,7 @@ def handle_web_exceptions(func: Callable[..., T]) -> Callable[..., T]:
     Returns:
         Wrapped function with web exception handling
     """
-
-    @wraps(func)
-    def wrapper(*args, **kwargs) -> T:
-        try:
-            return func(*args, **kwargs)
-        except (WebError, WebSearchError, WebContentError):
-            # Re-raise specific web errors
-            raise
-        except Exception as e:
-            # Convert generic exceptions to specific web errors
-            error_msg = str(e).lower()
-            if "search" in error_msg:
-                raise WebSearchError(str(e), details=f"Function: {func.__name__}")
-            elif "content" in error_msg or "extract" in error_msg:
-                raise WebContentError(str(e), details=f"Function: {func.__name__}")
-            else:
-                raise WebError(str(e), details=f"Function: {func.__name__}")
-
-    return wrapper
+    return _wrap_sync(func, WebError, _WEB_RULES)
 
 
 def handle_llm_exceptions(func: Callable[..., T]) -> Callable[..., T]:
@@ -104,25 +123,7 @@ def handle_llm_exceptions(func: Callable[..., T]) -> Callable[..., T]:
     Returns:
         Wrapped function with LLM exception handling
     """
-
-    @wraps(func)
-    def wrapper(*args, **kwargs) -> T:
-        try:
-            return func(*args, **kwargs)
-        except (LLMError, LLMTimeoutError, LLMConnectionError):
-            # Re-raise specific LLM errors
-            raise
-        except Exception as e:
-            # Convert generic exceptions to specific LLM errors
-            error_msg = str(e).lower()
-            if "timeout" in error_msg or "timed out" in error_msg:
-                raise LLMTimeoutError(str(e), details=f"Function: {func.__name__}")
-            elif "connection" in error_msg or "connect" in error_msg:
-                raise LLMConnectionError(str(e), details=f"Function: {func.__name__}")
-            else:
-                raise LLMError(str(e), details=f"Function: {func.__name__}")
-
-    return wrapper
+    return _wrap_sync(func, LLMError, _LLM_RULES)
 
 
 def handle_mcp_exceptions(func: Callable[..., T]) -> Callable[..., T]:
@@ -135,23 +136,7 @@ def handle_mcp_exceptions(func: Callable[..., T]) -> Callable[..., T]:
     Returns:
         Wrapped function with MCP exception handling
     """
-
-    @wraps(func)
-    def wrapper(*args, **kwargs) -> T:
-        try:
-            return func(*args, **kwargs)
-        except (MCPError, MCPToolError):
-            # Re-raise specific MCP errors
-            raise
-        except Exception as e:
-            # Convert generic exceptions to specific MCP errors
-            error_msg = str(e).lower()
-            if "tool" in error_msg:
-                raise MCPToolError(str(e), details=f"Function: {func.__name__}")
-            else:
-                raise MCPError(str(e), details=f"Function: {func.__name__}")
-
-    return wrapper
+    return _wrap_sync(func, MCPError, _MCP_RULES)
 
 
 def handle_research_exceptions(func: Callable[..., T]) -> Callable[..., T]:
@@ -164,19 +149,7 @@ def handle_research_exceptions(func: Callable[..., T]) -> Callable[..., T]:
     Returns:
         Wrapped function with research exception handling
     """
-
-    @wraps(func)
-    def wrapper(*args, **kwargs) -> T:
-        try:
-            return func(*args, **kwargs)
-        except ResearchError:
-            # Re-raise specific research errors
-            raise
-        except Exception as e:
-            # Convert generic exceptions to research errors
-            raise ResearchError(str(e), details=f"Function: {func.__name__}")
-
-    return wrapper
+    return _wrap_sync(func, ResearchError, _RESEARCH_RULES)
 
 
 def safe_execute(
@@ -255,6 +228,8 @@ def log_exception(
 class ExceptionContext:
     """Context manager for handling exceptions in specific contexts."""
 
+    __slots__ = ("context", "default_return", "reraise", "log_errors", "exception")
+
     def __init__(self, context: str, default_return: Any = None, reraise: bool = True, log_errors: bool = True):
         self.context = context
         self.default_return = default_return
@@ -281,43 +256,9 @@ class ExceptionContext:
 # Async versions of decorators
 def handle_async_browser_exceptions(func: Callable[..., T]) -> Callable[..., T]:
     """Async version of handle_browser_exceptions."""
-
-    @wraps(func)
-    async def wrapper(*args, **kwargs) -> T:
-        try:
-            return await func(*args, **kwargs)
-        except (BrowserError, BrowserSessionError, BrowserNavigationError, BrowserElementError):
-            raise
-        except Exception as e:
-            error_msg = str(e).lower()
-            if "session" in error_msg:
-                raise BrowserSessionError(str(e), details=f"Function: {func.__name__}")
-            elif "navigation" in error_msg or "navigate" in error_msg:
-                raise BrowserNavigationError(str(e), details=f"Function: {func.__name__}")
-            elif "element" in error_msg or "click" in error_msg or "fill" in error_msg:
-                raise BrowserElementError(str(e), details=f"Function: {func.__name__}")
-            else:
-                raise BrowserError(str(e), details=f"Function: {func.__name__}")
-
-    return wrapper
+    return _wrap_async(func, BrowserError, _BROWSER_RULES)
 
 
 def handle_async_web_exceptions(func: Callable[..., T]) -> Callable[..., T]:
     """Async version of handle_web_exceptions."""
-
-    @wraps(func)
-    async def wrapper(*args, **kwargs) -> T:
-        try:
-            return await func(*args, **kwargs)
-        except (WebError, WebSearchError, WebContentError):
-            raise
-        except Exception as e:
-            error_msg = str(e).lower()
-            if "search" in error_msg:
-                raise WebSearchError(str(e), details=f"Function: {func.__name__}")
-            elif "content" in error_msg or "extract" in error_msg:
-                raise WebContentError(str(e), details=f"Function: {func.__name__}")
-            else:
-                raise WebError(str(e), details=f"Function: {func.__name__}")
-
-    return wrapper
+    return _wrap_async(func, WebError, _WEB_RULES)
@@ -3,7 +3,19 @@ Helper functions for Swarm.
 """
 
 import re
-from urllib.parse import urlparse
+import string
+from urllib.parse import urlsplit
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# ASCII control characters that survive the ASCII round-trip in clean_text
+_CONTROL_CHARS = str.maketrans("", "", "".join(map(chr, [*range(0x20), 0x7F])))
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Characters allowed in the local part and in the domain before the TLD of an email address
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
 
 
 def sanitize_url(url: str) -> str:
@@ -20,8 +32,8 @@ def sanitize_url(url: str) -> str:
     if not url.startswith(("http://", "https://")):
         url = "https://" + url
 
-    # Parse and reconstruct URL
-    parsed = urlparse(url)
+    # Parse URL
+    parsed = urlsplit(url)
 
     # Basic validation
     if not parsed.netloc:
@@ -41,8 +53,7 @@ def extract_domain(url: str) -> str:
         Domain name
     """
     try:
-        parsed = urlparse(url)
-        return parsed.netloc
+        return urlsplit(url).netloc
     except Exception:
         return ""
 
@@ -58,10 +69,10 @@ def clean_text(text: str) -> str:
         Cleaned text
     """
     # Remove extra whitespace
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
 
-    # Remove non-printable characters
-    text = re.sub(r"[^\x20-\x7E]", "", text)
+    # Remove non-printable characters (non-ASCII first, then ASCII control characters)
+    text = text.encode("ascii", "ignore").decode("ascii").translate(_CONTROL_CHARS)
 
     return text.strip()
 
@@ -94,8 +105,22 @@ def is_valid_email(email: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    # Set membership checks instead of a backtracking regex; like the former "$" anchor,
+    # a single trailing newline is accepted
+    if email.endswith("\n"):
+        email = email[:-1]
+
+    local, _, domain = email.rpartition("@")
+    name, _, tld = domain.rpartition(".")
+    return (
+        bool(local)
+        and _EMAIL_LOCAL_CHARS.issuperset(local)
+        and bool(name)
+        and _EMAIL_DOMAIN_CHARS.issuperset(name)
+        and len(tld) >= 2
+        and tld.isascii()
+        and tld.isalpha()
+    )
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -111,12 +136,7 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
 
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    size = float(size_bytes)
-
-    while size >= 1024.0 and i < len(size_names) - 1:
-        size /= 1024.0
-        i += 1
+    # Each unit step is 2**10, so the unit index follows directly from the bit length
+    i = min((abs(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
 
-    return f"{size:.1f} {size_names[i]}"
+    return f"{size_bytes / (1 << (i * 10)):.1f} {_SIZE_UNITS[i]}"
@@ -20,9 +20,12 @@ def setup_logging(config: LoggingConfig) -> logging.Logger:
     Returns:
         Configured logger instance
     """
+    # Resolve the configured level once for the logger and all handlers
+    level = getattr(logging, config.level.upper())
+
     # Create logger
     logger = logging.getLogger("swarm")
-    logger.setLevel(getattr(logging, config.level.upper()))
+    logger.setLevel(level)
 
     # Clear existing handlers
     logger.handlers.clear()
@@ -30,10 +33,10 @@ def setup_logging(config: LoggingConfig) -> logging.Logger:
     # Create console handler with Rich
     console = Console()
     console_handler = RichHandler(console=console, show_time=True, show_path=False, markup=True)
-    console_handler.setLevel(getattr(logging, config.level.upper()))
+    console_handler.setLevel(level)
 
-    # Create formatter
-    formatter = logging.Formatter("%(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+    # Create formatter (RichHandler renders the timestamp itself)
+    formatter = logging.Formatter("%(message)s")
     console_handler.setFormatter(formatter)
 
     # Add console handler
@@ -42,7 +45,7 @@ def setup_logging(config: LoggingConfig) -> logging.Logger:
     # Add file handler if specified
     if config.file:
         file_handler = logging.FileHandler(config.file)
-        file_handler.setLevel(getattr(logging, config.level.upper()))
+        file_handler.setLevel(level)
 
         file_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         file_handler.setFormatter(file_formatter)
@@ -3,6 +3,7 @@ Streaming utilities for managing real-time LLM output display.
 """
 
 import asyncio
+import time
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -11,6 +12,9 @@ from rich.live import Live
 from rich.panel import Panel
 from rich.text import Text
 
+# Minimum seconds between renders of the streaming panel (10 frames per second)
+_RENDER_INTERVAL = 0.1
+
 
 @asynccontextmanager
 async def streaming_display(
@@ -36,35 +40,40 @@ async def streaming_display(
     if console is None:
         console = Console()
         
-    accumulated_text = ""
+    # Rich Text keeps its own list of appended segments, so appending stays cheap per token
     display_text = Text()
-    
-    def update_display(new_token: str) -> None:
-        """Update the streaming display with new token."""
-        nonlocal accumulated_text, display_text
-        accumulated_text += new_token
-        display_text = Text(accumulated_text)
-        
+
     def get_accumulated_text() -> str:
         """Get the accumulated text."""
-        return accumulated_text
-    
-    # Start the live display
+        return display_text.plain
+
+    # One panel wraps the shared Text, so a refresh picks up the newly appended tokens
+    panel = Panel(display_text, title=title, border_style=border_style)
+    last_render = 0.0
+
+    # Start the live display; renders are driven by live_update at most every _RENDER_INTERVAL
     with Live(
-        Panel(display_text, title=title, border_style=border_style),
+        panel,
         console=console,
-        refresh_per_second=10,
+        auto_refresh=False,
         transient=clear_after
     ) as live:
         
         # Provide update function to caller
         def live_update(token: str) -> None:
-            update_display(token)
-            live.update(Panel(display_text, title=title, border_style=border_style))
+            nonlocal last_render
+            display_text.append(token)
+            now = time.monotonic()
+            if now - last_render >= _RENDER_INTERVAL:
+                live.refresh()
+                last_render = now
             
         try:
             yield live_update, get_accumulated_text
         finally:
+            # Flush tokens that arrived since the last render
+            live.refresh()
+
             # Show completion and optionally clear
             if show_completion:
                 if clear_after:
@@ -74,23 +83,30 @@ async def streaming_display(
 
 class StreamingCollector:
     """Collects streaming tokens and manages display updates."""
-    
+
+    __slots__ = ("_parts", "update_callback")
+
     def __init__(self, update_callback: callable):
-        self.accumulated_text = ""
+        self._parts: list[str] = []
         self.update_callback = update_callback
-        
+
+    @property
+    def accumulated_text(self) -> str:
+        """Get the accumulated text."""
+        return "".join(self._parts)
+
     def add_token(self, token: str) -> None:
         """Add a new token to the stream."""
-        self.accumulated_text += token
+        self._parts.append(token)
         self.update_callback(token)
-        
+
     def get_text(self) -> str:
         """Get the complete accumulated text."""
-        return self.accumulated_text
-        
+        return "".join(self._parts)
+
     def clear(self) -> None:
         """Clear the accumulated text."""
-        self.accumulated_text = ""
+        self._parts.clear()
 
 
 async def stream_with_delay(tokens: list[str], delay: float = 0.05) -> AsyncGenerator[str, None]:
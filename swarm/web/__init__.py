@@ -2,7 +2,28 @@
 Web automation and browsing components for Swarm.
 """
 
-from swarm.web.browser import Browser
-from swarm.web.search import WebSearch
+from importlib import import_module
+from typing import Any
 
 __all__ = ["Browser", "WebSearch"]
+
+# Public name -> submodule that defines it; imported on first access (PEP 562)
+_LAZY_ATTRS = {
+    "Browser": "swarm.web.browser",
+    "WebSearch": "swarm.web.search",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import components lazily so importing swarm.web.search does not load Playwright."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
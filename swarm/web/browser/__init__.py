@@ -6,5 +6,6 @@ using Playwright, split into focused components for better maintainability.
 """
 
 from .browser import Browser
+from .pool import BrowserPool
 
-__all__ = ["Browser"]
+__all__ = ["Browser", "BrowserPool"]
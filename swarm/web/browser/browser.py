@@ -2,7 +2,10 @@
 Main Browser Class - Orchestrates all browser components in a clean, modular design.
 """
 
+import asyncio
 import logging
+import threading
+import time
 from typing import Any
 
 from swarm.core.config import BrowserConfig
@@ -25,6 +28,21 @@ class Browser:
     by composing focused components for different responsibilities.
     """
 
+    __slots__ = (
+        "config",
+        "session",
+        "navigator",
+        "interactor",
+        "extractor",
+        "utils",
+        "_session_loop",
+        "_legacy_loop",
+        "_legacy_thread",
+        "_last_activity",
+        "_watchdog",
+        "_navigation_count",
+    )
+
     def __init__(self, config: BrowserConfig):
         """
         Initialize browser with configuration.
@@ -43,6 +61,16 @@ class Browser:
         self.extractor: BrowserExtractor | None = None
         self.utils: BrowserUtils | None = None
 
+        # Event loop that started the session, and a lazily started loop for legacy sync calls
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+        self._legacy_loop: asyncio.AbstractEventLoop | None = None
+        self._legacy_thread: threading.Thread | None = None
+
+        # Idle watchdog and context recycling state (see config.idle_timeout / max_navigations_per_context)
+        self._last_activity = time.monotonic()
+        self._watchdog: asyncio.Task | None = None
+        self._navigation_count = 0
+
     @property
     def is_active(self) -> bool:
         """Check if browser session is active."""
@@ -61,13 +89,19 @@ class Browser:
             Session status information
         """
         try:
-            # Start the session
+            # Start the session; Playwright objects stay bound to this loop
+            self._session_loop = asyncio.get_running_loop()
             result = await self.session.start()
 
             if result["status"] == "success" and self.session.page:
                 # Initialize all components with the active page
                 self._initialize_components()
 
+                self._last_activity = time.monotonic()
+                self._navigation_count = 0
+                if self.config.idle_timeout:
+                    self._watchdog = asyncio.create_task(self._idle_watch())
+
                 logger.info("🚀 Browser session and all components initialized successfully")
 
             return result
@@ -84,6 +118,11 @@ class Browser:
             Closure status information
         """
         try:
+            # Stop the idle watchdog unless it is the one closing the session
+            if self._watchdog and self._watchdog is not asyncio.current_task():
+                self._watchdog.cancel()
+            self._watchdog = None
+
             # Clean up components
             self._cleanup_components()
 
@@ -96,12 +135,17 @@ class Browser:
         except Exception as e:
             logger.error(f"❌ Error closing browser session: {e}")
             raise
+        finally:
+            self._stop_legacy_loop()
 
     # Navigation Methods
-    async def navigate_to_url(self, url: str, wait_until: str = "domcontentloaded") -> dict[str, Any]:
+    async def navigate_to_url(
+        self, url: str, wait_until: str = "domcontentloaded", timeout: int = 30000, include_headers: bool = False
+    ) -> dict[str, Any]:
         """Navigate to URL using the navigator component."""
         self._ensure_active()
-        return await self.navigator.navigate_to_url(url, wait_until)
+        await self._recycle_context_if_needed()
+        return await self.navigator.navigate_to_url(url, wait_until, timeout, include_headers)
 
     async def get_current_url(self) -> str:
         """Get current page URL."""
@@ -109,9 +153,13 @@ class Browser:
         return await self.navigator.get_current_url()
 
     async def get_page_title(self) -> str:
-        """Get current page title."""
+        """Get current page title, cached by the session until the page changes."""
         self._ensure_active()
-        return await self.navigator.get_page_title()
+        try:
+            return await self.session.get_title()
+        except Exception as e:
+            logger.warning(f"Could not get page title: {e}")
+            return ""
 
     async def go_back(self) -> dict[str, Any]:
         """Navigate back in browser history."""
@@ -128,35 +176,92 @@ class Browser:
         self._ensure_active()
         return await self.navigator.reload(wait_until)
 
+    async def navigate_and_extract_batch(
+        self,
+        urls: list[str],
+        query: str | None = None,
+        max_length: int = 10000,
+        max_concurrency: int = 5,
+        wait_until: str = "domcontentloaded",
+    ) -> list[dict[str, Any]]:
+        """
+        Navigate to several URLs concurrently and extract their content.
+
+        Each URL is loaded in its own tab of the current browser context, with at most
+        ``max_concurrency`` tabs open at once. The main page is left untouched.
+
+        Args:
+            urls: URLs to visit
+            query: Optional search query to filter content
+            max_length: Maximum content length per page
+            max_concurrency: Maximum number of tabs loading at the same time
+            wait_until: When to consider each navigation complete
+
+        Returns:
+            One result per URL, in the same order as ``urls``
+        """
+        self._ensure_active()
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        normalized_urls = [self.navigator._normalize_url(url) for url in urls]
+
+        async def _navigate_and_extract(url: str) -> dict[str, Any]:
+            async with semaphore:
+                page = await self.session.new_page()
+                try:
+                    response = await page.goto(url, wait_until=wait_until)
+                    result = await BrowserExtractor(page).extract_page_content(query, max_length)
+                    result["url"] = page.url
+                    result["response_status"] = response.status if response else None
+                    return result
+                finally:
+                    await page.close()
+
+        results = await asyncio.gather(*(_navigate_and_extract(url) for url in normalized_urls), return_exceptions=True)
+
+        return [
+            {"status": "error", "url": url, "message": str(result)} if isinstance(result, BaseException) else result
+            for url, result in zip(normalized_urls, results)
+        ]
+
     # Interaction Methods
-    async def click_element_by_text(self, text: str, exact: bool = True, timeout: int = 5000) -> dict[str, Any]:
+    async def click_element_by_text(self, text: str, exact: bool = True, timeout: int | None = None) -> dict[str, Any]:
         """Click element by text using the interactor component."""
         self._ensure_active()
-        return await self.interactor.click_element_by_text(text, exact, timeout)
+        return await self.interactor.click_element_by_text(text, exact, self._element_timeout(timeout))
+
+    async def click_elements_by_text(
+        self, texts: list[str], exact: bool = True, timeout: int | None = None
+    ) -> dict[str, Any]:
+        """Click several elements by text, in order, looking them all up concurrently first."""
+        self._ensure_active()
+        return await self.interactor.click_elements_by_text(texts, exact, self._element_timeout(timeout))
 
     async def fill_input_by_label(
-        self, label: str, value: str, clear_first: bool = True, timeout: int = 5000
+        self, label: str, value: str, clear_first: bool = True, timeout: int | None = None
     ) -> dict[str, Any]:
         """Fill input field by label using the interactor component."""
         self._ensure_active()
-        return await self.interactor.fill_input_by_label(label, value, clear_first, timeout)
+        return await self.interactor.fill_input_by_label(label, value, clear_first, self._element_timeout(timeout))
 
     async def select_dropdown_option(
-        self, dropdown_label: str, option_value: str, timeout: int = 5000
+        self, dropdown_label: str, option_value: str, timeout: int | None = None
     ) -> dict[str, Any]:
         """Select dropdown option using the interactor component."""
         self._ensure_active()
-        return await self.interactor.select_dropdown_option(dropdown_label, option_value, timeout)
+        return await self.interactor.select_dropdown_option(
+            dropdown_label, option_value, self._element_timeout(timeout)
+        )
 
-    async def hover_element_by_text(self, text: str, timeout: int = 5000) -> dict[str, Any]:
+    async def hover_element_by_text(self, text: str, timeout: int | None = None) -> dict[str, Any]:
         """Hover over element by text."""
         self._ensure_active()
-        return await self.interactor.hover_element_by_text(text, timeout)
+        return await self.interactor.hover_element_by_text(text, self._element_timeout(timeout))
 
-    async def double_click_element_by_text(self, text: str, timeout: int = 5000) -> dict[str, Any]:
+    async def double_click_element_by_text(self, text: str, timeout: int | None = None) -> dict[str, Any]:
         """Double-click element by text."""
         self._ensure_active()
-        return await self.interactor.double_click_element_by_text(text, timeout)
+        return await self.interactor.double_click_element_by_text(text, self._element_timeout(timeout))
 
     # Content Extraction Methods
     async def extract_page_content(self, query: str | None = None, max_length: int = 10000) -> dict[str, Any]:
@@ -179,10 +284,12 @@ class Browser:
         self._ensure_active()
         return await self.extractor.extract_forms()
 
-    async def take_screenshot(self, path: str | None = None, full_page: bool = True) -> dict[str, Any]:
+    async def take_screenshot(
+        self, path: str | None = None, full_page: bool = False, image_type: str = "jpeg", quality: int = 60
+    ) -> dict[str, Any]:
         """Take screenshot using the extractor component."""
         self._ensure_active()
-        return await self.extractor.take_screenshot(path, full_page)
+        return await self.extractor.take_screenshot(path, full_page, image_type, quality)
 
     # Utility Methods
     async def get_page_elements(self) -> dict[str, list[dict[str, Any]]]:
@@ -194,12 +301,12 @@ class Browser:
         """Get current browser session status."""
         return await self.session.get_status()
 
-    async def wait_for_element_visible(self, text: str, timeout: int = 5000) -> bool:
+    async def wait_for_element_visible(self, text: str, timeout: int | None = None) -> bool:
         """Wait for element with text to be visible."""
         self._ensure_active()
         locator = await self.utils.find_element_by_text(text)
         if locator:
-            return await self.utils.wait_for_element_visible(locator, timeout)
+            return await self.utils.wait_for_element_visible(locator, self._element_timeout(timeout))
         return False
 
     async def scroll_to_element_by_text(self, text: str) -> bool:
@@ -213,7 +320,6 @@ class Browser:
     # Legacy Compatibility Methods
     def browse_persistent(self, url: str) -> dict[str, Any]:
         """Legacy method for compatibility - synchronous wrapper."""
-        import asyncio
 
         async def _browse():
             nav_result = await self.navigate_to_url(url)
@@ -230,18 +336,10 @@ class Browser:
             else:
                 raise BrowserError(nav_result["message"], url=url)
 
-        try:
-            # Try to get current running loop
-            asyncio.get_running_loop()
-            # If we're in an async context, we need to create a task
-            return asyncio.create_task(_browse())
-        except RuntimeError:
-            # No running loop, we can run directly
-            return asyncio.run(_browse())
+        return self._run_legacy(_browse())
 
     def extract_text_content(self, query: str | None = None) -> str:
         """Legacy method for compatibility - synchronous wrapper."""
-        import asyncio
 
         async def _extract():
             try:
@@ -250,29 +348,37 @@ class Browser:
             except Exception:
                 return ""
 
-        try:
-            asyncio.get_running_loop()
-            return asyncio.create_task(_extract())
-        except RuntimeError:
-            return asyncio.run(_extract())
+        return self._run_legacy(_extract())
 
     # Enhanced Methods
-    async def smart_search_and_click(self, search_terms: list[str], timeout: int = 10000) -> dict[str, Any]:
+    async def smart_search_and_click(self, search_terms: list[str], timeout: int | None = None) -> dict[str, Any]:
         """
         Smart search for elements using multiple search terms and click the best match.
 
         Args:
             search_terms: List of search terms in order of preference
-            timeout: Timeout for finding element
+            timeout: Timeout for finding element, defaults to config.smart_search_timeout
 
         Returns:
             Click result information
         """
         self._ensure_active()
+        if timeout is None:
+            timeout = self.config.smart_search_timeout
 
-        for term in search_terms:
+        # Look up every term concurrently, then click the most preferred match. The clicks are not
+        # raced, since a second click could land before the slower attempts are cancelled.
+        locators = await asyncio.gather(
+            *(self.utils.find_element_by_text(term, exact=False) for term in search_terms), return_exceptions=True
+        )
+
+        for term, locator in zip(search_terms, locators):
+            if not locator or isinstance(locator, Exception):
+                continue
             try:
-                result = await self.click_element_by_text(term, exact=False, timeout=timeout // len(search_terms))
+                result = await self.interactor.click_element_by_text(
+                    term, exact=False, timeout=timeout // len(search_terms), locator=locator
+                )
                 if result["status"] == "success":
                     return {
                         "status": "success",
@@ -286,13 +392,13 @@ class Browser:
 
         raise BrowserError(f"Could not find clickable element with any of the terms: {search_terms}")
 
-    async def smart_fill_form(self, form_data: dict[str, str], timeout: int = 5000) -> dict[str, Any]:
+    async def smart_fill_form(self, form_data: dict[str, str], timeout: int | None = None) -> dict[str, Any]:
         """
         Smart form filling that attempts to fill multiple fields.
 
         Args:
             form_data: Dictionary of label -> value mappings
-            timeout: Timeout for finding each element
+            timeout: Timeout for finding each element, defaults to config.element_timeout
 
         Returns:
             Form filling results
@@ -302,9 +408,23 @@ class Browser:
         results = []
         successful_fills = 0
 
-        for label, value in form_data.items():
+        # Resolve all fields concurrently; filling stays sequential because fill() types into
+        # whichever element has focus, so overlapping fills could land in the wrong field
+        semaphore = asyncio.Semaphore(4)
+
+        async def _find_input(label: str):
+            async with semaphore:
+                return await self.utils.find_input_by_label(label)
+
+        locators = await asyncio.gather(*(_find_input(label) for label in form_data), return_exceptions=True)
+
+        for (label, value), locator in zip(form_data.items(), locators):
             try:
-                result = await self.fill_input_by_label(label, value, timeout=timeout)
+                if isinstance(locator, Exception):
+                    raise locator
+                result = await self.interactor.fill_input_by_label(
+                    label, value, timeout=self._element_timeout(timeout), locator=locator
+                )
                 results.append(
                     {"label": label, "value": value, "status": result["status"], "message": result.get("message", "")}
                 )
@@ -321,15 +441,107 @@ class Browser:
             "message": f"Successfully filled {successful_fills}/{len(form_data)} fields",
         }
 
+    def _element_timeout(self, timeout: int | None) -> int:
+        """Use the configured element timeout unless the caller passed one."""
+        return self.config.element_timeout if timeout is None else timeout
+
+    def _run_legacy(self, coro):
+        """
+        Run a coroutine on behalf of a legacy synchronous wrapper and return its result.
+
+        The coroutine is dispatched to the loop that started the session when that loop runs in
+        another thread, or otherwise to this browser's persistent background loop, instead of
+        creating and tearing down a new loop on every call. Only when called from the session's
+        own loop (or with no session yet) inside running async code is a task returned, since
+        blocking there would deadlock the loop that drives Playwright.
+        """
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        session_loop = self._session_loop
+        session_elsewhere = session_loop is not None and session_loop is not running_loop and session_loop.is_running()
+
+        if running_loop is not None and not session_elsewhere:
+            return asyncio.create_task(coro)
+
+        loop = session_loop if session_elsewhere else self._get_legacy_loop()
+        try:
+            return asyncio.run_coroutine_threadsafe(coro, loop).result()
+        finally:
+            # A session closed from the legacy loop itself could not stop it there
+            if not self.is_active:
+                self._stop_legacy_loop()
+
+    def _get_legacy_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the background event loop used by legacy synchronous wrappers, starting its thread if needed."""
+        if self._legacy_loop is None:
+            self._legacy_loop = asyncio.new_event_loop()
+        if self._legacy_thread is None:
+            self._legacy_thread = threading.Thread(
+                target=self._legacy_loop.run_forever, name="swarm-browser-legacy", daemon=True
+            )
+            self._legacy_thread.start()
+        return self._legacy_loop
+
+    def _stop_legacy_loop(self) -> None:
+        """
+        Stop the legacy background loop and join its thread; the next legacy call restarts it.
+
+        The loop itself is kept rather than closed, so browsers BrowserPool keeps warm on it can
+        still be reused, or closed, once it runs again.
+        """
+        loop, thread = self._legacy_loop, self._legacy_thread
+        if loop is None or thread is None:
+            return
+
+        try:
+            if asyncio.get_running_loop() is loop:
+                return  # Stopping here would strand the running call; _run_legacy stops it once the call returns
+        except RuntimeError:
+            pass
+
+        self._legacy_thread = None
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+    async def _recycle_context_if_needed(self) -> None:
+        """Start a fresh context once the current one has served max_navigations_per_context."""
+        limit = self.config.max_navigations_per_context
+        if not limit:
+            return
+
+        self._navigation_count += 1
+        if self._navigation_count > limit:
+            await self.session.recycle_context()
+            self._initialize_components()
+            self._navigation_count = 1
+
+    async def _idle_watch(self) -> None:
+        """Close the session once it has been idle for longer than config.idle_timeout seconds."""
+        idle_timeout = self.config.idle_timeout
+        while self.is_active:
+            await asyncio.sleep(min(30, idle_timeout))
+            if time.monotonic() - self._last_activity > idle_timeout:
+                logger.info(f"💤 Closing browser session after {idle_timeout}s without activity")
+                try:
+                    await self.close_session()
+                except Exception as e:
+                    logger.warning(f"Idle browser session did not close cleanly: {e}")
+                return
+
     def _initialize_components(self) -> None:
         """Initialize all browser components with the active page."""
         if not self.session.page:
             raise BrowserSessionError("No active page available for component initialization")
 
-        self.navigator = BrowserNavigator(self.session.page)
-        self.interactor = BrowserInteractor(self.session.page)
-        self.extractor = BrowserExtractor(self.session.page)
+        # One utilities instance is shared by every component
         self.utils = BrowserUtils(self.session.page)
+        self.navigator = BrowserNavigator(self.session.page)
+        self.extractor = BrowserExtractor(self.session.page, self.utils)
+        # Interactions can re-render the page without navigating, so they invalidate cached extractions
+        self.interactor = BrowserInteractor(self.session.page, self.utils, on_change=self.extractor.clear_cache)
 
         logger.debug("✅ All browser components initialized")
 
@@ -344,14 +556,18 @@ class Browser:
 
     def _ensure_active(self) -> None:
         """Ensure browser session is active and components are initialized."""
+        self._last_activity = time.monotonic()
+
         if not self.is_active:
             raise BrowserSessionError("Browser session is not active. Call start_session() first.")
 
         if not all([self.navigator, self.interactor, self.extractor, self.utils]):
             raise BrowserSessionError("Browser components not initialized. Session may have been corrupted.")
 
-    def __aenter__(self):
-        """Async context manager entry."""
+    async def __aenter__(self):
+        """Async context manager entry; starts the session unless it is already running."""
+        if not self.is_active:
+            await self.start_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -2,9 +2,17 @@
 Browser Extractor - Handles content extraction and page analysis.
 """
 
+import asyncio
+import copy
+import functools
+import hashlib
+import heapq
 import logging
 import re
+import time
+from pathlib import Path
 from typing import Any
+from urllib.parse import urlsplit
 
 from playwright.async_api import Page
 
@@ -15,14 +23,158 @@ from .utils import BrowserUtils
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used by BrowserExtractor._clean_content
+_WHITESPACE_RE = re.compile(r"\s+")
+_BOILERPLATE_RE = re.compile(r"(?:Advertisement|Skip to content)\s*")
+
+# Common content selectors in order of preference
+_CONTENT_SELECTORS = [
+    "main",
+    "article",
+    "[role='main']",
+    ".content",
+    ".main-content",
+    "#content",
+    "#main",
+    ".post-content",
+    ".entry-content",
+    ".article-content",
+]
+
+# Seconds an extraction result is reused for repeated calls on the same, un-navigated page;
+# short because scripts can still change the DOM without navigating
+_RESULT_CACHE_TTL = 2.0
+
+# Upper bound on page text fetched for query filtering, so huge pages do not ship megabytes over CDP
+_MAX_QUERY_SCAN_CHARS = 1_000_000
+
+# Captures the page in a single page.evaluate() call: the main content text (largest block of the
+# first matching selector, else the body) with whitespace collapsed and clipped to the limit in the
+# page, plus the title, meta tags and headings, so only the kept data crosses CDP
+_PAGE_CAPTURE_JS = """
+([selectors, limit]) => {
+    let text = "";
+    for (const selector of selectors) {
+        let largest = "";
+        for (const el of document.querySelectorAll(selector)) {
+            const value = el.innerText || "";
+            if (value.length > largest.length) largest = value;
+        }
+        if (largest.trim()) {
+            text = largest;
+            break;
+        }
+    }
+    if (!text && document.body) text = document.body.innerText || "";
+
+    text = text.replace(/\\s+/g, " ").trim();
+    const clipped = limit > 0 && text.length > limit;
+
+    const meta = {};
+    for (const el of document.querySelectorAll("meta")) {
+        const content = el.getAttribute("content");
+        if (!content) continue;
+        const key = el.getAttribute("name") || el.getAttribute("property");
+        if (key) meta[key] = content;
+    }
+
+    const headings = [];
+    for (let level = 1; level <= 6 && headings.length < 10; level++) {
+        for (const el of document.querySelectorAll(`h${level}`)) {
+            const value = (el.innerText || "").trim();
+            if (value) headings.push({ level, text: value.slice(0, 100) });
+            if (headings.length >= 10) break;
+        }
+    }
+
+    return {
+        text: clipped ? text.slice(0, limit) : text,
+        clipped,
+        metadata: { title: document.title, meta, headings },
+    };
+}
+"""
+
+# Link, image and form data are each collected in a single page.evaluate() call. URLs come from the
+# DOM's resolved href/src properties, so relative references are already absolute. Records that
+# would be discarded anyway are filtered out in the page, so only usable ones cross CDP.
+_LINKS_JS = """
+() => {
+    const isHidden = (el) =>
+        !el.getClientRects().length ||
+        getComputedStyle(el).visibility === "hidden" ||
+        el.closest("[aria-hidden='true']") !== null;
+    const links = [];
+    for (const el of document.querySelectorAll("a[href], area[href], [role='link']")) {
+        // Skip javascript:, mailto: and other non-web links
+        const href = el.getAttribute("href") ? el.href : "";
+        if (!(href.startsWith("http://") || href.startsWith("https://")) || isHidden(el)) continue;
+        const text = (el.innerText || el.getAttribute("aria-label") || "").trim();
+        if (text) links.push([text.slice(0, 100), href]);
+    }
+    return links;
+}
+"""
+
+_IMAGES_JS = """
+(includeDataUrls) => Array.from(document.images, (img) => [
+    img.getAttribute("src") ? img.src : "",
+    (img.getAttribute("alt") || "").slice(0, 100),
+    (img.getAttribute("title") || "").slice(0, 100),
+    img.getAttribute("width") || "",
+    img.getAttribute("height") || "",
+]).filter(([src]) => src && (includeDataUrls || !src.startsWith("data:")))
+"""
+
+_FORMS_JS = """
+() => Array.from(document.forms, (form) => ({
+    action: form.getAttribute("action") || "",
+    method: form.getAttribute("method") || "",
+    name: form.getAttribute("name") || "",
+    inputs: Array.from(form.querySelectorAll("input, textarea, select"), (el) => ({
+        type: el.getAttribute("type") || "text",
+        name: el.getAttribute("name") || "",
+        id: el.getAttribute("id") || "",
+        placeholder: el.getAttribute("placeholder") || "",
+        required: el.hasAttribute("required"),
+    })),
+}))
+"""
+
+
+@functools.lru_cache(maxsize=2048)
+def _domain_from_url(url: str) -> str:
+    """Extract scheme and host from a URL; cached because pages repeat the same links and hosts."""
+    try:
+        parsed = urlsplit(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+    except Exception:
+        return ""
+
+
+def _file_digest(path: str) -> str | None:
+    """SHA-256 digest of a file's contents, or None if it cannot be read."""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
 
 class BrowserExtractor:
     """Handles browser content extraction with enhanced capabilities."""
 
-    def __init__(self, page: Page):
-        """Initialize extractor with page reference."""
+    def __init__(self, page: Page, utils: BrowserUtils | None = None):
+        """Initialize extractor with page reference and an optional shared utilities instance."""
         self.page = page
-        self.utils = BrowserUtils(page)
+        self.utils = utils or BrowserUtils(page)
+
+        # SHA-256 digest of the last screenshot written, to skip rewriting an identical capture; reset on navigation
+        self._last_shot_hash: str | None = None
+
+        # Recent extraction results, dropped whenever the main frame navigates
+        self._result_cache: dict[tuple, tuple[float, dict[str, Any]]] = {}
+        if page:
+            page.on("framenavigated", self._handle_frame_navigated)
 
     @handle_async_browser_exceptions
     async def extract_page_content(self, query: str | None = None, max_length: int = 10000) -> dict[str, Any]:
@@ -39,15 +191,19 @@ class BrowserExtractor:
         if not self.page:
             raise BrowserError("No active page available for content extraction")
 
+        cache_key = ("content", self.page.url, query, max_length)
+        cached = self._get_cached_result(cache_key)
+        if cached:
+            return cached
+
         try:
-            logger.info(f"📄 Extracting page content (max_length: {max_length})")
+            logger.debug(f"📄 Extracting page content (max_length: {max_length})")
 
-            # Extract main content using multiple strategies
-            content = await self._extract_main_content()
+            # Query filtering scans a large prefix of the text; otherwise keep headroom for the cleanup patterns
+            limit = _MAX_QUERY_SCAN_CHARS if query else max_length * 2
 
-            if not content:
-                # Fallback to body text
-                content = await self.page.inner_text("body")
+            # Extract main content (or body text) and metadata in a single page round-trip
+            content, clipped, metadata = await self._capture_page(limit)
 
             # Clean and process content
             content = self._clean_content(content)
@@ -61,19 +217,21 @@ class BrowserExtractor:
             if truncated:
                 content = content[:max_length] + "..."
 
-            # Extract additional metadata
-            metadata = await self._extract_page_metadata()
-
             logger.info(f"✅ Extracted {len(content)} characters of content")
 
-            return {
-                "status": "success",
-                "content": content,
-                "length": len(content),
-                "query": query,
-                "truncated": truncated,
-                "metadata": metadata,
-            }
+            return self._cache_result(
+                cache_key,
+                {
+                    "status": "success",
+                    "content": content,
+                    "length": len(content),
+                    "query": query,
+                    "truncated": truncated,
+                    # The page text was cut to the scan limit before cleaning and query filtering
+                    "clipped": clipped,
+                    "metadata": metadata,
+                },
+            )
 
         except Exception as e:
             logger.error(f"❌ Content extraction failed: {e}")
@@ -89,58 +247,46 @@ class BrowserExtractor:
         Returns:
             Links information
         """
+        cache_key = ("links", self.page.url, filter_internal)
+        cached = self._get_cached_result(cache_key)
+        if cached:
+            return cached
+
         try:
-            logger.info("🔗 Extracting page links")
+            logger.debug("🔗 Extracting page links")
 
             links = []
             current_domain = self._get_domain_from_url(self.page.url)
 
-            # Get all link elements
-            link_elements = await self.page.get_by_role("link").all()
-
-            for link in link_elements:
-                try:
-                    text = await link.inner_text()
-                    href = await link.get_attribute("href")
-
-                    if not href or not text.strip():
-                        continue
-
-                    # Resolve relative URLs
-                    if href.startswith("/"):
-                        href = f"{current_domain}{href}"
-                    elif href.startswith("//"):
-                        href = f"https:{href}"
-                    elif not href.startswith(("http://", "https://")):
-                        continue
-
-                    link_domain = self._get_domain_from_url(href)
-                    is_internal = link_domain == current_domain
-
-                    # Filter if requested
-                    if filter_internal and not is_internal:
-                        continue
-
-                    links.append(
-                        {
-                            "text": text.strip()[:100],
-                            "href": href,
-                            "domain": link_domain,
-                            "is_internal": is_internal,
-                        }
-                    )
-
-                except Exception:
+            # Get text and resolved href of all visible web links in one round-trip
+            for text, href in await self.page.evaluate(_LINKS_JS):
+                link_domain = self._get_domain_from_url(href)
+                is_internal = link_domain == current_domain
+
+                # Filter if requested
+                if filter_internal and not is_internal:
                     continue
 
+                links.append(
+                    {
+                        "text": text,
+                        "href": href,
+                        "domain": link_domain,
+                        "is_internal": is_internal,
+                    }
+                )
+
             logger.info(f"✅ Extracted {len(links)} links")
 
-            return {
-                "status": "success",
-                "links": links,
-                "total_count": len(links),
-                "current_domain": current_domain,
-            }
+            return self._cache_result(
+                cache_key,
+                {
+                    "status": "success",
+                    "links": links,
+                    "total_count": len(links),
+                    "current_domain": current_domain,
+                },
+            )
 
         except Exception as e:
             logger.error(f"❌ Link extraction failed: {e}")
@@ -157,50 +303,22 @@ class BrowserExtractor:
             Images information
         """
         try:
-            logger.info("🖼️ Extracting page images")
+            logger.debug("🖼️ Extracting page images")
 
             images = []
-            current_domain = self._get_domain_from_url(self.page.url)
 
-            # Get all image elements
-            img_elements = await self.page.locator("img").all()
-
-            for img in img_elements:
-                try:
-                    src = await img.get_attribute("src")
-                    alt = await img.get_attribute("alt") or ""
-                    title = await img.get_attribute("title") or ""
-
-                    if not src:
-                        continue
-
-                    # Skip data URLs if not requested
-                    if not include_data_urls and src.startswith("data:"):
-                        continue
-
-                    # Resolve relative URLs
-                    if src.startswith("/"):
-                        src = f"{current_domain}{src}"
-                    elif src.startswith("//"):
-                        src = f"https:{src}"
-
-                    # Get image dimensions if possible
-                    width = await img.get_attribute("width") or ""
-                    height = await img.get_attribute("height") or ""
-
-                    images.append(
-                        {
-                            "src": src,
-                            "alt": alt[:100],
-                            "title": title[:100],
-                            "width": width,
-                            "height": height,
-                            "is_data_url": src.startswith("data:"),
-                        }
-                    )
-
-                except Exception:
-                    continue
+            # Get resolved src and attributes of all images in one round-trip, skipping data URLs unless requested
+            for src, alt, title, width, height in await self.page.evaluate(_IMAGES_JS, include_data_urls):
+                images.append(
+                    {
+                        "src": src,
+                        "alt": alt,
+                        "title": title,
+                        "width": width,
+                        "height": height,
+                        "is_data_url": src.startswith("data:"),
+                    }
+                )
 
             logger.info(f"✅ Extracted {len(images)} images")
 
@@ -222,57 +340,23 @@ class BrowserExtractor:
             Forms information
         """
         try:
-            logger.info("📝 Extracting page forms")
+            logger.debug("📝 Extracting page forms")
 
             forms = []
 
-            # Get all form elements
-            form_elements = await self.page.locator("form").all()
-
-            for i, form in enumerate(form_elements):
-                try:
-                    action = await form.get_attribute("action") or ""
-                    method = await form.get_attribute("method") or "GET"
-                    name = await form.get_attribute("name") or f"form_{i}"
-
-                    # Get form inputs
-                    inputs = []
-                    input_elements = await form.locator("input, textarea, select").all()
-
-                    for input_elem in input_elements:
-                        try:
-                            input_type = await input_elem.get_attribute("type") or "text"
-                            input_name = await input_elem.get_attribute("name") or ""
-                            input_id = await input_elem.get_attribute("id") or ""
-                            placeholder = await input_elem.get_attribute("placeholder") or ""
-                            required = await input_elem.get_attribute("required") is not None
-
-                            inputs.append(
-                                {
-                                    "type": input_type,
-                                    "name": input_name,
-                                    "id": input_id,
-                                    "placeholder": placeholder,
-                                    "required": required,
-                                }
-                            )
-
-                        except Exception:
-                            continue
-
-                    forms.append(
-                        {
-                            "index": i,
-                            "name": name,
-                            "action": action,
-                            "method": method.upper(),
-                            "inputs": inputs,
-                            "input_count": len(inputs),
-                        }
-                    )
-
-                except Exception:
-                    continue
+            # Get all forms with their inputs in one round-trip
+            for i, form in enumerate(await self.page.evaluate(_FORMS_JS)):
+                inputs = form["inputs"]
+                forms.append(
+                    {
+                        "index": i,
+                        "name": form["name"] or f"form_{i}",
+                        "action": form["action"],
+                        "method": (form["method"] or "GET").upper(),
+                        "inputs": inputs,
+                        "input_count": len(inputs),
+                    }
+                )
 
             logger.info(f"✅ Extracted {len(forms)} forms")
 
@@ -286,94 +370,81 @@ class BrowserExtractor:
             logger.error(f"❌ Form extraction failed: {e}")
             raise BrowserError(f"Form extraction failed: {str(e)}")
 
-    async def take_screenshot(self, path: str | None = None, full_page: bool = True) -> dict[str, Any]:
+    async def take_screenshot(
+        self, path: str | None = None, full_page: bool = False, image_type: str = "jpeg", quality: int = 60
+    ) -> dict[str, Any]:
         """
         Take screenshot with enhanced options.
 
         Args:
             path: Optional path to save screenshot
-            full_page: Whether to capture full page
+            full_page: Whether to capture full page (renders the whole scroll height)
+            image_type: Image format, "jpeg" or "png"
+            quality: JPEG quality (0-100); ignored for PNG
 
         Returns:
             Screenshot result information
         """
         try:
             if not path:
-                # Generate filename based on page title and URL
-                title = await self.page.title()
-                safe_title = re.sub(r"[^\w\-_.]", "_", title)[:50]
-                path = f"screenshot_{safe_title}.png"
-
-            # Take screenshot with options
-            await self.page.screenshot(
-                path=path, full_page=full_page, type="png", quality=90 if not full_page else None
+                # Generate a short, filesystem-safe filename from the page URL
+                url_hash = hashlib.md5(self.page.url.encode()).hexdigest()[:16]
+                extension = "jpg" if image_type == "jpeg" else image_type
+                path = f"screenshot_{url_hash}.{extension}"
+
+            # Capture into memory, then write the file without blocking the event loop
+            data = await self.page.screenshot(
+                full_page=full_page, type=image_type, quality=quality if image_type == "jpeg" else None
             )
 
-            logger.info(f"✅ Screenshot saved: {path}")
+            # Skip the write only when the file at path still holds exactly this capture
+            digest = hashlib.sha256(data).hexdigest()
+            unchanged = digest == self._last_shot_hash and await asyncio.to_thread(_file_digest, path) == digest
+            if not unchanged:
+                await asyncio.to_thread(Path(path).write_bytes, data)
+                self._last_shot_hash = digest
+
+            logger.info(f"✅ Screenshot {'unchanged' if unchanged else 'saved'}: {path}")
 
             return {
                 "status": "success",
                 "path": path,
                 "full_page": full_page,
-                "message": f"Screenshot saved to {path}",
+                "bytes": len(data),
+                "unchanged": unchanged,
+                "message": f"Screenshot {'unchanged at' if unchanged else 'saved to'} {path}",
             }
 
         except Exception as e:
             logger.error(f"❌ Screenshot failed: {e}")
             raise BrowserError(f"Screenshot failed: {str(e)}")
 
-    async def _extract_main_content(self) -> str:
-        """Extract main content using semantic selectors."""
-        # Common content selectors in order of preference
-        content_selectors = [
-            "main",
-            "article",
-            "[role='main']",
-            ".content",
-            ".main-content",
-            "#content",
-            "#main",
-            ".post-content",
-            ".entry-content",
-            ".article-content",
-        ]
-
-        for selector in content_selectors:
-            try:
-                elements = await self.page.locator(selector).all()
-                if elements:
-                    # Get the largest content block
-                    largest_content = ""
-                    for element in elements:
-                        try:
-                            text = await element.inner_text()
-                            if len(text) > len(largest_content):
-                                largest_content = text
-                        except Exception:
-                            continue
-
-                    if largest_content.strip():
-                        return largest_content
-            except Exception:
-                continue
+    async def _capture_page(self, limit: int = 0) -> tuple[str, bool, dict[str, Any]]:
+        """
+        Capture main content and page metadata, falling back to the body text.
 
-        return ""
+        Args:
+            limit: Maximum number of content characters to return, or 0 for no limit
+
+        Returns:
+            Tuple of (whitespace-normalized text, whether it was clipped to the limit, metadata)
+        """
+        capture = await self.page.evaluate(_PAGE_CAPTURE_JS, [_CONTENT_SELECTORS, limit])
+
+        metadata = capture["metadata"]
+        metadata["url"] = self.page.url
+        return capture["text"], capture["clipped"], metadata
 
     def _clean_content(self, content: str) -> str:
         """Clean and normalize content."""
         if not content:
             return ""
 
-        # Normalize whitespace
-        content = re.sub(r"\s+", " ", content)
+        # Normalize whitespace (this also removes every line break)
+        content = _WHITESPACE_RE.sub(" ", content)
 
-        # Remove excessive line breaks
-        content = re.sub(r"\n{3,}", "\n\n", content)
-
-        # Clean up common unwanted patterns
-        content = re.sub(r"Advertisement\s*", "", content)
-        content = re.sub(r"Skip to content\s*", "", content)
-        content = re.sub(r"Cookie notice\s*.*?\n", "", content, flags=re.IGNORECASE)
+        # Clean up common unwanted patterns in one pass
+        content = _BOILERPLATE_RE.sub("", content)
 
         return content.strip()
 
@@ -383,14 +454,24 @@ class BrowserExtractor:
             return content
 
         query_words = [word.lower() for word in query.split()]
-        sentences = content.split(".")
+
+        # Words containing a period can never occur inside a single sentence
+        searchable = [word for word in dict.fromkeys(query_words) if "." not in word]
+        if not searchable:
+            return content
+
+        # One regex scan finds matching words; only the sentences around them are scored
+        words_re = re.compile("|".join(map(re.escape, searchable)), re.IGNORECASE)
         relevant_sentences = []
 
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
+        match = words_re.search(content)
+        while match:
+            start = content.rfind(".", 0, match.start()) + 1
+            end = content.find(".", match.end())
+            if end == -1:
+                end = len(content)
 
+            sentence = content[start:end].strip()
             sentence_lower = sentence.lower()
 
             # Score sentence based on query word matches
@@ -400,68 +481,39 @@ class BrowserExtractor:
             if score > 0:
                 relevant_sentences.append((sentence, score))
 
+            # Resume after this sentence so each sentence is scored once
+            match = words_re.search(content, end + 1)
+
         if relevant_sentences:
-            # Sort by score and take top sentences
-            relevant_sentences.sort(key=lambda x: x[1], reverse=True)
-            top_sentences = [s[0] for s in relevant_sentences[:20]]  # Top 20 sentences
-            return ". ".join(top_sentences)
+            # Take the top 20 sentences by score, keeping document order among ties
+            top_sentences = heapq.nlargest(20, relevant_sentences, key=lambda x: x[1])
+            return ". ".join(s[0] for s in top_sentences)
 
         return content  # Return full content if no matches
 
-    async def _extract_page_metadata(self) -> dict[str, Any]:
-        """Extract page metadata."""
-        metadata = {}
-
-        try:
-            # Basic metadata
-            metadata["title"] = await self.page.title()
-            metadata["url"] = self.page.url
-
-            # Meta tags
-            meta_elements = await self.page.locator("meta").all()
-            meta_data = {}
-
-            for meta in meta_elements:
-                try:
-                    name = await meta.get_attribute("name")
-                    property_attr = await meta.get_attribute("property")
-                    content = await meta.get_attribute("content")
-
-                    if content:
-                        if name:
-                            meta_data[name] = content
-                        elif property_attr:
-                            meta_data[property_attr] = content
-                except Exception:
-                    continue
-
-            metadata["meta"] = meta_data
-
-            # Headings structure
-            headings = []
-            for level in range(1, 7):
-                h_elements = await self.page.locator(f"h{level}").all()
-                for h in h_elements:
-                    try:
-                        text = await h.inner_text()
-                        if text.strip():
-                            headings.append({"level": level, "text": text.strip()[:100]})
-                    except Exception:
-                        continue
-
-            metadata["headings"] = headings[:10]  # Limit to 10 headings
-
-        except Exception as e:
-            logger.debug(f"Could not extract metadata: {e}")
-
-        return metadata
+    def clear_cache(self) -> None:
+        """Drop cached extraction results, e.g. after an interaction that may have changed the page."""
+        self._result_cache.clear()
+
+    def _get_cached_result(self, key: tuple) -> dict[str, Any] | None:
+        """Return a copy of a cached result younger than _RESULT_CACHE_TTL seconds, if any."""
+        entry = self._result_cache.get(key)
+        if entry and time.monotonic() - entry[0] < _RESULT_CACHE_TTL:
+            logger.debug(f"Using cached {key[0]} extraction for {key[1]}")
+            return copy.deepcopy(entry[1])
+        return None
+
+    def _cache_result(self, key: tuple, result: dict[str, Any]) -> dict[str, Any]:
+        """Remember an extraction result and return a copy the caller may modify, nested values included."""
+        self._result_cache[key] = (time.monotonic(), result)
+        return copy.deepcopy(result)
+
+    def _handle_frame_navigated(self, frame) -> None:
+        """Drop cached results when the main document changes."""
+        if frame is self.page.main_frame:
+            self._result_cache.clear()
+            self._last_shot_hash = None
 
     def _get_domain_from_url(self, url: str) -> str:
         """Extract domain from URL."""
-        try:
-            from urllib.parse import urlparse
-
-            parsed = urlparse(url)
-            return f"{parsed.scheme}://{parsed.netloc}"
-        except Exception:
-            return ""
+        return _domain_from_url(url)
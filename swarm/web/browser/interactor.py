@@ -2,10 +2,12 @@
 Browser Interactor - Handles element interactions like click, fill, and select operations.
 """
 
+import asyncio
 import logging
+from collections.abc import Callable
 from typing import Any
 
-from playwright.async_api import Page
+from playwright.async_api import Locator, Page
 
 from swarm.core.exceptions import BrowserElementError
 from swarm.utils.exception_handler import handle_async_browser_exceptions
@@ -14,17 +16,40 @@ from .utils import BrowserUtils
 
 logger = logging.getLogger(__name__)
 
+# Index of the first <option> whose text contains the lowercased needle, or -1
+_FIND_OPTION_JS = """
+(select, needle) => Array.from(select.options).findIndex((option) => option.innerText.toLowerCase().includes(needle))
+"""
+
+# Longest wait between retries of a failed click, fill or select, in milliseconds
+_RETRY_DELAY_MS = 200
+
 
 class BrowserInteractor:
     """Handles browser element interactions with enhanced reliability."""
 
-    def __init__(self, page: Page):
-        """Initialize interactor with page reference."""
+    def __init__(self, page: Page, utils: BrowserUtils | None = None, on_change: Callable[[], None] | None = None):
+        """
+        Initialize interactor with page reference and an optional shared utilities instance.
+
+        Args:
+            page: Page to interact with
+            utils: Shared utilities instance, created if not given
+            on_change: Called after every click, fill, select, hover or double-click, since each may change the page
+        """
         self.page = page
-        self.utils = BrowserUtils(page)
+        self.utils = utils or BrowserUtils(page)
+        self._on_change = on_change
+
+        # Elements resolved on the current document, keyed by _find() arguments; cleared on navigation
+        self._locator_cache: dict[tuple[str, str, bool, bool], Locator] = {}
+        if page:
+            page.on("framenavigated", self._handle_frame_navigated)
 
     @handle_async_browser_exceptions
-    async def click_element_by_text(self, text: str, exact: bool = True, timeout: int = 5000) -> dict[str, Any]:
+    async def click_element_by_text(
+        self, text: str, exact: bool = True, timeout: int = 5000, locator: Locator | None = None
+    ) -> dict[str, Any]:
         """
         Click element by text with enhanced reliability and multiple strategies.
 
@@ -32,6 +57,7 @@ class BrowserInteractor:
             text: Text to search for and click
             exact: Whether to match exact text
             timeout: Timeout for finding element
+            locator: Element already resolved for this text, skipping the lookup
 
         Returns:
             Click result information
@@ -43,16 +69,12 @@ class BrowserInteractor:
             logger.info(f"🖱️ Attempting to click element with text: '{text}'")
 
             # Find element using utility
-            locator = await self.utils.find_element_by_text(text, exact)
+            # An exact lookup falls back to a partial match within the same page scan
+            if locator is None:
+                locator = await self._find("element", text, exact, partial_fallback=True)
 
             if not locator:
-                # Try partial match if exact match failed
-                if exact:
-                    logger.debug(f"Exact match failed, trying partial match for: {text}")
-                    locator = await self.utils.find_element_by_text(text, exact=False)
-
-                if not locator:
-                    raise BrowserElementError(f"Could not find clickable element with text: {text}", element=text)
+                raise BrowserElementError(f"Could not find clickable element with text: {text}", element=text)
 
             # Wait for element to be clickable
             if not await self.utils.wait_for_element_clickable(locator, timeout):
@@ -62,7 +84,10 @@ class BrowserInteractor:
                     raise BrowserElementError(f"Element with text '{text}' is not clickable", element=text)
 
             # Perform click with retry logic
-            await self._click_with_retry(locator, text)
+            try:
+                await self._click_with_retry(locator, text)
+            finally:
+                self._page_changed()
 
             logger.info(f"✅ Successfully clicked element with text: '{text}'")
 
@@ -79,9 +104,57 @@ class BrowserInteractor:
             logger.error(f"❌ Click failed for text '{text}': {e}")
             raise BrowserElementError(f"Click failed: {str(e)}", element=text)
 
+    async def click_elements_by_text(self, texts: list[str], exact: bool = True, timeout: int = 5000) -> dict[str, Any]:
+        """
+        Click several elements by text, in the given order.
+
+        All elements are looked up concurrently first; the clicks stay sequential because each
+        one can change the page the next acts on. Lookups invalidated by a navigation are redone.
+
+        Args:
+            texts: Texts of the elements to click, in click order
+            exact: Whether to match exact text
+            timeout: Timeout for finding each element
+
+        Returns:
+            Per-element click results
+        """
+        semaphore = asyncio.Semaphore(4)
+
+        async def _prefetch(text: str) -> None:
+            async with semaphore:
+                await self._find("element", text, exact, partial_fallback=True)
+
+        # Warm the locator cache; lookup failures surface again from the click itself
+        await asyncio.gather(*(_prefetch(text) for text in texts), return_exceptions=True)
+
+        results = []
+        successful_clicks = 0
+        for text in texts:
+            try:
+                result = await self.click_element_by_text(text, exact, timeout)
+                results.append({"text": text, "status": result["status"], "message": result.get("message", "")})
+                if result["status"] == "success":
+                    successful_clicks += 1
+            except Exception as e:
+                results.append({"text": text, "status": "error", "message": str(e)})
+
+        return {
+            "status": "success" if successful_clicks > 0 else "error",
+            "successful_clicks": successful_clicks,
+            "total_elements": len(texts),
+            "results": results,
+            "message": f"Successfully clicked {successful_clicks}/{len(texts)} elements",
+        }
+
     @handle_async_browser_exceptions
     async def fill_input_by_label(
-        self, label: str, value: str, clear_first: bool = True, timeout: int = 5000
+        self,
+        label: str,
+        value: str,
+        clear_first: bool = True,
+        timeout: int = 5000,
+        locator: Locator | None = None,
     ) -> dict[str, Any]:
         """
         Fill input field by label with enhanced reliability.
@@ -89,8 +162,9 @@ class BrowserInteractor:
         Args:
             label: Label text to find input field
             value: Value to fill
-            clear_first: Whether to clear field before filling
+            clear_first: Whether to replace the field's content; otherwise the value is appended to it
             timeout: Timeout for finding element
+            locator: Input already resolved for this label, skipping the lookup
 
         Returns:
             Fill result information
@@ -102,7 +176,8 @@ class BrowserInteractor:
             logger.info(f"✏️ Attempting to fill input '{label}' with: '{value}'")
 
             # Find input using utility
-            locator = await self.utils.find_input_by_label(label)
+            if locator is None:
+                locator = await self._find("input", label)
 
             if not locator:
                 raise BrowserElementError(f"Could not find input field for label: {label}", element=label)
@@ -114,11 +189,14 @@ class BrowserInteractor:
             if not await self.utils.is_element_enabled(locator):
                 raise BrowserElementError(f"Input field with label '{label}' is disabled", element=label)
 
-            # Scroll to element if needed
-            await self.utils.scroll_to_element(locator)
+            # fill() replaces the content, so appending fills the current text followed by the value
+            text = value if clear_first else await locator.input_value() + value
 
-            # Clear and fill with enhanced reliability
-            await self._fill_with_retry(locator, value, clear_first, label)
+            # Fill with enhanced reliability; fill() scrolls the input into view itself
+            try:
+                await self._fill_with_retry(locator, text, label)
+            finally:
+                self._page_changed()
 
             logger.info(f"✅ Successfully filled input '{label}' with: '{value}'")
 
@@ -158,7 +236,7 @@ class BrowserInteractor:
             logger.info(f"📋 Attempting to select option '{option_value}' in dropdown '{dropdown_label}'")
 
             # Find select element using utility
-            locator = await self.utils.find_select_by_label(dropdown_label)
+            locator = await self._find("select", dropdown_label)
 
             if not locator:
                 raise BrowserElementError(
@@ -174,11 +252,11 @@ class BrowserInteractor:
             if not await self.utils.is_element_enabled(locator):
                 raise BrowserElementError(f"Dropdown with label '{dropdown_label}' is disabled", element=dropdown_label)
 
-            # Scroll to element if needed
-            await self.utils.scroll_to_element(locator)
-
-            # Select option with multiple strategies
-            await self._select_with_retry(locator, option_value, dropdown_label)
+            # Select option with multiple strategies; select_option() scrolls the dropdown into view itself
+            try:
+                await self._select_with_retry(locator, option_value, dropdown_label)
+            finally:
+                self._page_changed()
 
             logger.info(f"✅ Successfully selected option '{option_value}' in dropdown '{dropdown_label}'")
 
@@ -210,7 +288,7 @@ class BrowserInteractor:
             logger.info(f"🎯 Attempting to hover over element with text: '{text}'")
 
             # Find element using utility
-            locator = await self.utils.find_element_by_text(text)
+            locator = await self._find("element", text)
 
             if not locator:
                 raise BrowserElementError(f"Could not find element with text: {text}", element=text)
@@ -221,7 +299,10 @@ class BrowserInteractor:
 
             # Scroll to element and hover
             await self.utils.scroll_to_element(locator)
-            await locator.hover()
+            try:
+                await locator.hover()
+            finally:
+                self._page_changed()
 
             logger.info(f"✅ Successfully hovered over element with text: '{text}'")
 
@@ -250,7 +331,7 @@ class BrowserInteractor:
             logger.info(f"🖱️🖱️ Attempting to double-click element with text: '{text}'")
 
             # Find element using utility
-            locator = await self.utils.find_element_by_text(text)
+            locator = await self._find("element", text)
 
             if not locator:
                 raise BrowserElementError(f"Could not find element with text: {text}", element=text)
@@ -261,7 +342,10 @@ class BrowserInteractor:
 
             # Scroll to element and double-click
             await self.utils.scroll_to_element(locator)
-            await locator.dblclick()
+            try:
+                await locator.dblclick()
+            finally:
+                self._page_changed()
 
             logger.info(f"✅ Successfully double-clicked element with text: '{text}'")
 
@@ -275,6 +359,57 @@ class BrowserInteractor:
             logger.error(f"❌ Double-click failed for text '{text}': {e}")
             raise BrowserElementError(f"Double-click failed: {str(e)}", element=text)
 
+    async def _find(self, kind: str, text: str, exact: bool = True, partial_fallback: bool = False) -> Locator | None:
+        """
+        Find an element through BrowserUtils, reusing a locator resolved earlier on the same document.
+
+        Args:
+            kind: "element" for clickable text, "input" or "select" for form fields by label
+            text: Text or label to search for
+            exact: Whether to match exact text (elements only)
+            partial_fallback: With exact, accept a partial match when nothing matches exactly (elements only)
+
+        Returns:
+            Locator for the element or None if not found
+        """
+        key = (kind, text, exact, partial_fallback)
+        locator = self._locator_cache.get(key)
+
+        # Confirming a cached locator still costs a count() round-trip, but it skips the
+        # _FIND_ELEMENT_JS page scan and the fallback strategies
+        if locator is not None:
+            if await locator.count():
+                return locator
+            del self._locator_cache[key]
+
+        if kind == "input":
+            locator = await self.utils.find_input_by_label(text)
+        elif kind == "select":
+            locator = await self.utils.find_select_by_label(text)
+        else:
+            locator = await self.utils.find_element_by_text(text, exact, partial_fallback)
+
+        if locator:
+            self._locator_cache[key] = locator
+        return locator
+
+    def _page_changed(self) -> None:
+        """Tell the owner that an interaction may have changed the page, even if it failed part way."""
+        if self._on_change:
+            self._on_change()
+
+    def _handle_frame_navigated(self, frame) -> None:
+        """Forget resolved elements when the main document changes."""
+        if frame is self.page.main_frame:
+            self._locator_cache.clear()
+
+    async def _wait_before_retry(self, locator: Locator, state: str) -> None:
+        """Wait until the element reaches the given state, at most _RETRY_DELAY_MS, before retrying."""
+        try:
+            await locator.wait_for(state=state, timeout=_RETRY_DELAY_MS)
+        except Exception:
+            pass  # Retry anyway; the next strategy may still succeed
+
     async def _click_with_retry(self, locator, text: str, max_retries: int = 3) -> None:
         """Click element with retry logic."""
         last_error = None
@@ -299,23 +434,21 @@ class BrowserInteractor:
                 logger.debug(f"Click attempt {attempt + 1} failed for '{text}': {e}")
 
                 if attempt < max_retries - 1:
-                    await self.page.wait_for_timeout(500)  # Wait before retry
+                    await self._wait_before_retry(locator, "visible")
 
         # All retries failed
         raise last_error
 
-    async def _fill_with_retry(self, locator, value: str, clear_first: bool, label: str, max_retries: int = 3) -> None:
+    async def _fill_with_retry(self, locator, value: str, label: str, max_retries: int = 3) -> None:
         """Fill input with retry logic."""
         last_error = None
 
         for attempt in range(max_retries):
             try:
-                if clear_first:
-                    # Clear field first
-                    await locator.clear()
-
-                # Fill value
-                await locator.fill(value)
+                # Fill value; fill() replaces the current content, so no separate clear() round-trip is needed.
+                # The caller already checked visibility and enablement, so the first attempt skips
+                # Playwright's actionability checks; retries run them in case the page changed.
+                await locator.fill(value, force=attempt == 0)
 
                 # Verify the value was set correctly
                 current_value = await locator.input_value()
@@ -335,7 +468,7 @@ class BrowserInteractor:
                 logger.debug(f"Fill attempt {attempt + 1} failed for '{label}': {e}")
 
                 if attempt < max_retries - 1:
-                    await self.page.wait_for_timeout(500)  # Wait before retry
+                    await self._wait_before_retry(locator, "visible")
 
         # All retries failed
         raise last_error
@@ -359,14 +492,12 @@ class BrowserInteractor:
                         index = int(option_value)
                         await locator.select_option(index=index)
                     except ValueError:
-                        # If not numeric, try partial text match
-                        options = await locator.locator("option").all()
-                        for i, option in enumerate(options):
-                            option_text = await option.inner_text()
-                            if option_value.lower() in option_text.lower():
-                                await locator.select_option(index=i)
-                                return
-                        raise ValueError(f"Could not find option containing '{option_value}'")
+                        # If not numeric, try partial text match, scanning all options in one round-trip
+                        index = await locator.evaluate(_FIND_OPTION_JS, option_value.lower())
+                        if index < 0:
+                            raise ValueError(f"Could not find option containing '{option_value}'")
+                        await locator.select_option(index=index)
+                        return
 
                 return  # Success
 
@@ -375,7 +506,7 @@ class BrowserInteractor:
                 logger.debug(f"Select attempt {attempt + 1} failed for '{dropdown_label}': {e}")
 
                 if attempt < max_retries - 1:
-                    await self.page.wait_for_timeout(500)  # Wait before retry
+                    await self._wait_before_retry(locator, "attached")
 
         # All retries failed
         raise last_error
@@ -2,7 +2,9 @@
 Browser Navigator - Handles navigation and URL operations.
 """
 
+import functools
 import logging
+import time
 from typing import Any
 from urllib.parse import urlparse
 
@@ -14,6 +16,17 @@ from swarm.utils.exception_handler import handle_async_browser_exceptions
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _is_valid_url(url: str) -> bool:
+    """Validate URL format; cached because agents revisit the same URLs."""
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return False
+    # Either domain or path for file URLs
+    return parsed.scheme in ("http", "https", "file", "data") and bool(parsed.netloc or parsed.path)
+
+
 class BrowserNavigator:
     """Handles browser navigation operations with enhanced reliability."""
 
@@ -22,13 +35,19 @@ class BrowserNavigator:
         self.page = page
 
     @handle_async_browser_exceptions
-    async def navigate_to_url(self, url: str, wait_until: str = "domcontentloaded") -> dict[str, Any]:
+    async def navigate_to_url(
+        self, url: str, wait_until: str = "domcontentloaded", timeout: int = 30000, include_headers: bool = False
+    ) -> dict[str, Any]:
         """
         Navigate to URL with enhanced error handling and validation.
 
         Args:
             url: URL to navigate to
             wait_until: When to consider navigation complete
+            timeout: Timeout in milliseconds shared by the request and the wait for wait_until. Only
+                network errors (net::ERR_*) retry the request, each retry with a fresh timeout. When
+                the wait runs out, the committed page is returned instead of an error
+            include_headers: Whether to copy response headers into the redirect chain
 
         Returns:
             Navigation result with page information
@@ -45,7 +64,7 @@ class BrowserNavigator:
             logger.info(f"🌐 Navigating to: {normalized_url}")
 
             # Navigate with retries and enhanced options
-            response = await self._navigate_with_retry(normalized_url, wait_until)
+            response = await self._navigate_with_retry(normalized_url, wait_until, timeout)
 
             # Get page information
             title = await self.page.title()
@@ -64,7 +83,7 @@ class BrowserNavigator:
                 "title": title,
                 "response_status": response_status,
                 "message": f"Successfully navigated to {title}",
-                "redirect_chain": await self._get_redirect_chain(response) if response else [],
+                "redirect_chain": await self._get_redirect_chain(response, include_headers) if response else [],
             }
 
         except Exception as e:
@@ -132,65 +151,54 @@ class BrowserNavigator:
         """Normalize URL by adding protocol if missing."""
         url = url.strip()
 
-        # Add protocol if missing
-        if not url.startswith(("http://", "https://", "file://", "data:")):
-            # Check if it's likely a domain (contains a dot)
-            if "." in url and not url.startswith("localhost"):
-                url = "https://" + url
-            elif url.startswith("localhost") or url.startswith("127.0.0.1"):
-                url = "http://" + url
-            else:
-                # Assume it's a search query if no clear URL structure
-                url = "https://" + url
-
-        return url
+        # Add protocol if missing: plain HTTP for local servers, HTTPS for everything else
+        if url.startswith(("http://", "https://", "file://", "data:")):
+            return url
+        if url.startswith(("localhost", "127.0.0.1")):
+            return "http://" + url
+        return "https://" + url
 
     def _is_valid_url(self, url: str) -> bool:
         """Validate URL format."""
-        try:
-            parsed = urlparse(url)
-            return all(
-                [
-                    parsed.scheme in ("http", "https", "file", "data"),
-                    parsed.netloc or parsed.path,  # Either domain or path for file URLs
-                ]
-            )
-        except Exception:
-            return False
-
-    async def _navigate_with_retry(self, url: str, wait_until: str, max_retries: int = 3):
-        """Navigate with retry logic for better reliability."""
+        return _is_valid_url(url)
+
+    async def _navigate_with_retry(self, url: str, wait_until: str, timeout: int = 30000, max_retries: int = 3):
+        """
+        Navigate once and wait for the requested load state, re-requesting the page only on network errors.
+
+        The request and the load-state wait share the timeout. A page that is slow to reach the load
+        state keeps loading instead of being fetched again; the committed page is returned once the
+        timeout runs out.
+        """
         last_error = None
 
         for attempt in range(max_retries):
+            started = time.monotonic()
             try:
-                # Different wait strategies for retries
-                if attempt == 0:
-                    # First attempt: fast load
-                    response = await self.page.goto(url, wait_until=wait_until, timeout=30000)
-                elif attempt == 1:
-                    # Second attempt: wait for network idle
-                    response = await self.page.goto(url, wait_until="networkidle", timeout=45000)
-                else:
-                    # Final attempt: just load
-                    response = await self.page.goto(url, wait_until="load", timeout=60000)
-
-                return response
-
+                response = await self.page.goto(url, wait_until="commit", timeout=timeout)
             except Exception as e:
                 last_error = e
                 logger.warning(f"Navigation attempt {attempt + 1} failed for {url}: {e}")
 
-                if attempt < max_retries - 1:
-                    # Wait before retry
-                    await self.page.wait_for_timeout(1000 * (attempt + 1))
-                    continue
+                # Only connection-level failures (net::ERR_*) are worth another request
+                if "net::" not in str(e) or attempt == max_retries - 1:
+                    break
+                await self.page.wait_for_timeout(1000 * (attempt + 1))
+                continue
+
+            remaining = timeout - (time.monotonic() - started) * 1000
+            if wait_until != "commit" and remaining > 0:
+                try:
+                    await self.page.wait_for_load_state(wait_until, timeout=remaining)
+                except Exception:
+                    logger.debug(f"Page still loading for {url}, continuing with committed page")
+
+            return response
 
-        # All retries failed
         raise last_error
 
-    async def _get_redirect_chain(self, response) -> list[dict[str, Any]]:
-        """Get the redirect chain from the response."""
+    async def _get_redirect_chain(self, response, include_headers: bool = False) -> list[dict[str, Any]]:
+        """Get the redirect chain from the response, final response first."""
         try:
             if not response:
                 return []
@@ -203,14 +211,13 @@ class BrowserNavigator:
                     {
                         "url": current.url,
                         "status": current.status,
-                        "headers": dict(current.headers) if hasattr(current, "headers") else {},
+                        "headers": dict(current.headers) if include_headers else None,
                     }
                 )
 
-                # Get the next response in the chain
-                current = getattr(current, "request", {}).get("redirected_from")
-                if not current:
-                    break
+                # Step back to the response that redirected here; most navigations have none
+                redirected_from = current.request.redirected_from
+                current = await redirected_from.response() if redirected_from else None
 
             return chain
         except Exception as e:
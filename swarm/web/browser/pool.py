@@ -0,0 +1,285 @@
+"""
+Browser Pool - Keeps launched Chromium processes warm and shares them across sessions.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from playwright.async_api import Browser as PlaywrightBrowser
+from playwright.async_api import Playwright, async_playwright
+
+from swarm.core.config import BrowserConfig
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """
+    Process-wide pool of launched browsers.
+
+    Sessions acquire a browser, open their own BrowserContext on it, and release the
+    browser when done instead of closing it, so only the first session pays for the
+    Chromium launch. Connections to an external browser (CDP endpoint) are shared the
+    same way. Idle browsers are kept for later sessions, bounded by pool_size and
+    pool_max_uses; once no session has held one for idle_timeout seconds (if set) the
+    pool shuts down. Otherwise it stays up until shutdown() or process exit, which ends
+    the driver and the browsers it launched. Playwright objects are bound to the event
+    loop that created them, so the pool closes them and starts over when used from a
+    different loop.
+    """
+
+    _playwright: Playwright | None = None
+    _loop: asyncio.AbstractEventLoop | None = None
+    _lock: asyncio.Lock | None = None
+    _idle: dict[tuple, list[PlaywrightBrowser]] = {}
+    _keys: dict[PlaywrightBrowser, tuple] = {}
+    _uses: dict[PlaywrightBrowser, int] = {}
+    _connections: dict[str, PlaywrightBrowser] = {}
+    _active: int = 0
+    _reaper: asyncio.TimerHandle | None = None
+    _reaping: asyncio.Task | None = None
+
+    @classmethod
+    async def acquire(cls, launch_options: dict[str, Any]) -> PlaywrightBrowser:
+        """
+        Get a browser launched with the given options, reusing an idle one if possible.
+
+        Args:
+            launch_options: Options for chromium.launch()
+
+        Returns:
+            Launched Playwright browser
+        """
+        lock = await cls._bind_to_running_loop()
+        key = cls._make_key(launch_options)
+
+        # Count the session before launching so a pending idle shutdown leaves the driver running
+        cls._active += 1
+        cls._cancel_reaper()
+        try:
+            async with lock:
+                idle = cls._idle.get(key, [])
+                while idle:
+                    browser = idle.pop()
+                    if browser.is_connected():
+                        cls._uses[browser] += 1
+                        logger.debug("♻️ Reusing pooled browser")
+                        return browser
+                    cls._forget(browser)
+
+                playwright = await cls._start_playwright()
+                browser = await playwright.chromium.launch(**launch_options)
+                cls._keys[browser] = key
+                cls._uses[browser] = 1
+                logger.debug("🚀 Launched new pooled browser")
+                return browser
+        except Exception:
+            cls._active -= 1
+            raise
+
+    @classmethod
+    async def connect(cls, endpoint: str) -> PlaywrightBrowser:
+        """
+        Get a CDP connection to an already running browser, shared by all sessions.
+
+        Args:
+            endpoint: CDP endpoint of the running browser, e.g. http://localhost:9222
+
+        Returns:
+            Connected Playwright browser; sessions open their own contexts on it
+        """
+        lock = await cls._bind_to_running_loop()
+
+        cls._active += 1
+        cls._cancel_reaper()
+        try:
+            async with lock:
+                browser = cls._connections.get(endpoint)
+                if browser is None or not browser.is_connected():
+                    playwright = await cls._start_playwright()
+                    browser = await playwright.chromium.connect_over_cdp(endpoint)
+                    cls._connections[endpoint] = browser
+                    logger.debug(f"🔌 Connected to shared browser at {endpoint}")
+                return browser
+        except Exception:
+            cls._active -= 1
+            raise
+
+    @classmethod
+    async def release(cls, browser: PlaywrightBrowser, config: BrowserConfig) -> None:
+        """
+        Return a browser to the pool, closing it if it is worn out or the pool is full.
+
+        After the last release the pool stays warm for the next session; with an idle_timeout
+        it shuts down if no session acquires a browser within that many seconds.
+
+        Args:
+            browser: Browser previously returned by acquire() or connect()
+            config: Browser configuration with pool limits
+        """
+        if cls._loop is not asyncio.get_running_loop():
+            # Acquired on a loop that no longer backs the pool, so it cannot be reused
+            await cls._close_browsers([browser])
+            return
+
+        cls._active = max(cls._active - 1, 0)
+
+        # Shared CDP connections stay open while other sessions may still use them
+        if browser not in cls._connections.values():
+            key = cls._keys.get(browser)
+            idle = cls._idle.setdefault(key, []) if key is not None else None
+
+            if (
+                idle is None
+                or not browser.is_connected()
+                or cls._uses.get(browser, 0) >= config.pool_max_uses
+                or len(idle) >= config.pool_size
+            ):
+                cls._forget(browser)
+                await cls._close_browsers([browser])
+            else:
+                idle.append(browser)
+
+        if cls._active == 0 and config.idle_timeout:
+            cls._cancel_reaper()
+            cls._reaper = asyncio.get_running_loop().call_later(config.idle_timeout, cls._reap)
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close all idle browsers and shared connections, and stop Playwright."""
+        if cls._loop is not None and cls._loop is not asyncio.get_running_loop():
+            await cls._close_stale()
+            return
+
+        # Wait for launches in progress so the driver is not stopped underneath them
+        lock = cls._lock
+        if lock is None:
+            return
+        async with lock:
+            teardown = cls._close_all(cls._playwright, cls._pooled_browsers())
+            cls._clear()
+            await teardown
+
+    @classmethod
+    def _reap(cls) -> None:
+        """Shut the pool down after it sat unused for idle_timeout seconds."""
+        cls._reaper = None
+        if cls._active == 0:
+            logger.debug("💤 Shutting down idle browser pool")
+            cls._reaping = asyncio.ensure_future(cls.shutdown())
+
+    @classmethod
+    def _cancel_reaper(cls) -> None:
+        """Cancel a pending idle shutdown."""
+        if cls._reaper is not None:
+            cls._reaper.cancel()
+            cls._reaper = None
+
+    @classmethod
+    def _pooled_browsers(cls) -> list[PlaywrightBrowser]:
+        """Idle browsers and shared connections; closing a connection only disconnects from the external browser."""
+        return [browser for browsers in cls._idle.values() for browser in browsers] + list(cls._connections.values())
+
+    @classmethod
+    async def _close_all(cls, playwright: Playwright | None, browsers: list[PlaywrightBrowser]) -> None:
+        """Close the given browsers, then stop the Playwright driver that owns them."""
+        await cls._close_browsers(browsers)
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception as e:
+                logger.debug(f"Error stopping Playwright: {e}")
+
+    @staticmethod
+    async def _close_browsers(browsers: list[PlaywrightBrowser]) -> None:
+        """Close browsers, ignoring ones that are already gone."""
+        for browser in browsers:
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled browser: {e}")
+
+    @classmethod
+    async def _close_stale(
+        cls, loop: asyncio.AbstractEventLoop | None = None, lock: asyncio.Lock | None = None
+    ) -> None:
+        """
+        Forget what another event loop left in the pool and close it on that loop.
+
+        Args:
+            loop: Loop to bind the pool to before waiting on the teardown, if any
+            lock: Pool lock to use on that loop
+        """
+        old_loop = cls._loop
+        teardown = cls._close_all(cls._playwright, cls._pooled_browsers())
+        cls._reset()
+        cls._loop = loop
+        cls._lock = lock
+
+        if old_loop is None or old_loop.is_closed():
+            # Nothing can run on a closed loop; its subprocess transports were torn down with it
+            teardown.close()
+            return
+
+        try:
+            if old_loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(teardown, old_loop))
+            else:
+                await asyncio.to_thread(old_loop.run_until_complete, teardown)
+        except Exception as e:
+            logger.debug(f"Error closing browsers from a previous event loop: {e}")
+
+    @classmethod
+    async def _start_playwright(cls) -> Playwright:
+        """Start the shared Playwright driver once; callers must hold the pool lock."""
+        if cls._playwright is None:
+            cls._playwright = await async_playwright().start()
+            logger.debug("🎭 Started shared Playwright driver")
+        return cls._playwright
+
+    @classmethod
+    async def _bind_to_running_loop(cls) -> asyncio.Lock:
+        """
+        Close state created on another event loop, which cannot be used from this one.
+
+        Returns:
+            The pool lock for the running loop
+        """
+        loop = asyncio.get_running_loop()
+        lock = cls._lock
+        if cls._loop is not loop or lock is None:
+            lock = asyncio.Lock()
+            await cls._close_stale(loop, lock)
+        return lock
+
+    @classmethod
+    def _reset(cls) -> None:
+        """Forget all pooled state, including the event loop the pool is bound to."""
+        cls._clear()
+        cls._loop = None
+        cls._lock = None
+        cls._active = 0
+
+    @classmethod
+    def _clear(cls) -> None:
+        """Forget the driver, browsers and connections; sessions still holding a browser keep counting."""
+        cls._cancel_reaper()
+        cls._playwright = None
+        cls._idle = {}
+        cls._keys = {}
+        cls._uses = {}
+        cls._connections = {}
+
+    @classmethod
+    def _forget(cls, browser: PlaywrightBrowser) -> None:
+        """Stop tracking a browser."""
+        cls._keys.pop(browser, None)
+        cls._uses.pop(browser, None)
+
+    @staticmethod
+    def _make_key(launch_options: dict[str, Any]) -> tuple:
+        """Build a hashable key so only browsers with identical launch options are shared."""
+        return tuple(
+            sorted((name, tuple(value) if isinstance(value, list) else value) for name, value in launch_options.items())
+        )
@@ -2,31 +2,126 @@
 Browser Session Management - Handles browser lifecycle and session state.
 """
 
+import asyncio
 import logging
 from typing import Any
+from urllib.parse import urlsplit
 
 from playwright.async_api import Browser as PlaywrightBrowser
-from playwright.async_api import BrowserContext, Page, async_playwright
+from playwright.async_api import BrowserContext, CDPSession, Frame, Page
 
 from swarm.core.config import BrowserConfig
 from swarm.core.exceptions import BrowserSessionError
 from swarm.utils.exception_handler import handle_async_browser_exceptions
 
+from .pool import BrowserPool
+
 logger = logging.getLogger(__name__)
 
+# Chromium launch arguments, built once; identical arguments also let BrowserPool share browsers
+_COMMON_BROWSER_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-client-side-phishing-detection",
+    "--disable-crash-reporter",
+    "--disable-oopr-debug-crash-dump",
+    "--no-crash-upload",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-low-res-tiling",
+    "--log-level=3",
+    "--silent",
+)
+# Use /tmp instead of the often tiny /dev/shm for shared memory when running many headless tabs
+_HEADLESS_ARGS = ("--disable-dev-shm-usage",)
+_HEADED_ARGS = ("--new-window", "--start-maximized")
+
+# Seconds a failed start may spend releasing what it had already opened
+_CLEANUP_TIMEOUT = 5
+
+# Context identity shared by every session; never mutated
+_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+_EXTRA_HTTP_HEADERS = {
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+}
+
+# Requests failed inside the browser (see BrowserSession._block_requests): resource types, and ads/analytics
+# hosts as DevTools Fetch URL patterns
+_HEADLESS_BLOCKED_TYPES = frozenset({"image", "media", "font"})
+_HEADED_BLOCKED_TYPES = frozenset({"font"})
+_LIGHTWEIGHT_BLOCKED_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+_BLOCKED_URL_PATTERNS = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*facebook.com/tr*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+)
+
+
+def _origin(url: str) -> str:
+    """Scheme and host of a URL."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
 
 class BrowserSession:
     """Manages browser session lifecycle and state."""
 
+    __slots__ = (
+        "config",
+        "browser",
+        "context",
+        "page",
+        "_session_active",
+        "_title",
+        "_blocked_types",
+        "_blocked_patterns",
+        "_page_blockers",
+        "_frame_blockers",
+        "_frame_origins",
+        "_frame_tasks",
+    )
+
     def __init__(self, config: BrowserConfig):
         """Initialize browser session manager."""
         self.config = config
-        self.playwright = None
         self.browser: PlaywrightBrowser | None = None
         self.context: BrowserContext | None = None
         self.page: Page | None = None
         self._session_active = False
 
+        # Page title cache, cleared by page events whenever the main document changes
+        self._title: str | None = None
+
+        # Resource types aborted for every page in the session's context
+        if config.lightweight_mode:
+            self._blocked_types = _LIGHTWEIGHT_BLOCKED_TYPES
+        else:
+            blocked_types = _HEADLESS_BLOCKED_TYPES if config.headless else _HEADED_BLOCKED_TYPES
+            self._blocked_types = blocked_types | {"stylesheet"} if config.block_stylesheets else blocked_types
+
+        # Fetch.enable patterns: only matching requests are paused and reported back to Python
+        self._blocked_patterns = [{"resourceType": kind.capitalize()} for kind in sorted(self._blocked_types)]
+        self._blocked_patterns += [{"urlPattern": pattern} for pattern in _BLOCKED_URL_PATTERNS]
+
+        # Request blockers being set up for pages of the context, and DevTools sessions of out-of-process iframes
+        self._page_blockers: dict[Page, asyncio.Future] = {}
+        self._frame_blockers: dict[Frame, CDPSession] = {}
+
+        # Origin each iframe was last checked at, and the checks still running
+        self._frame_origins: dict[Frame, str] = {}
+        self._frame_tasks: set[asyncio.Task] = set()
+
     @property
     def is_active(self) -> bool:
         """Check if browser session is active."""
@@ -44,9 +139,6 @@ class BrowserSession:
             return {"status": "already_active", "message": "Browser session already running"}
 
         try:
-            # Start Playwright
-            self.playwright = await async_playwright().start()
-
             # Enhanced browser launch options for better performance and compatibility
             launch_options = {
                 "headless": self.config.headless,
@@ -54,29 +146,16 @@ class BrowserSession:
                 "args": self._get_browser_args(),
             }
 
-            # Launch browser with optimized settings
-            self.browser = await self.playwright.chromium.launch(**launch_options)
-
-            # Create context with enhanced settings
-            context_options = {
-                "viewport": {"width": self.config.viewport_width, "height": self.config.viewport_height},
-                "user_agent": self._get_user_agent(),
-                "extra_http_headers": {
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br",
-                },
-                "ignore_https_errors": True,  # Better error handling
-                "java_script_enabled": True,
-            }
-
-            self.context = await self.browser.new_context(**context_options)
+            if self.config.cdp_endpoint:
+                # Share one connection to an already running browser; each session still gets its own context
+                self.browser = await BrowserPool.connect(self.config.cdp_endpoint)
+            else:
+                # Reuse a warm browser from the pool; only the context is created per session
+                self.browser = await BrowserPool.acquire(launch_options)
 
-            # Create page with optimized settings
-            self.page = await self.context.new_page()
-            self.page.set_default_timeout(self.config.timeout)
-
-            # Set up page-level optimizations
-            await self._setup_page_optimizations()
+            # Create context and page with enhanced settings
+            context_options = self._get_context_options()
+            await self._open_page(context_options)
 
             self._session_active = True
 
@@ -114,16 +193,14 @@ class BrowserSession:
             if self.context:
                 await self.context.close()
                 self.context = None
+                self._forget_frames()
 
             if self.browser:
-                await self.browser.close()
+                await self._release_browser()
                 self.browser = None
 
-            if self.playwright:
-                await self.playwright.stop()
-                self.playwright = None
-
             self._session_active = False
+            self._title = None
 
             logger.info("✅ Browser session closed successfully")
             return {"status": "success", "message": "Browser session closed"}
@@ -147,7 +224,7 @@ class BrowserSession:
 
         try:
             current_url = self.page.url
-            title = await self.page.title()
+            title = await self.get_title()
 
             # Additional status information
             network_idle = await self._check_network_idle()
@@ -173,75 +250,191 @@ class BrowserSession:
                 "error": str(e),
             }
 
+    async def get_title(self) -> str:
+        """
+        Get the current page title, fetching it from the browser only after the page changed.
+
+        Returns:
+            Page title, or an empty string if there is no active page
+        """
+        if not self.page:
+            return ""
+
+        if self._title is None:
+            self._title = await self.page.title()
+        return self._title
+
+    async def recycle_context(self) -> None:
+        """
+        Replace the page and context with fresh ones on the same browser.
+
+        Long-lived contexts accumulate memory, so periodically starting over caps the
+        session's footprint. Cookies and storage of the old context are discarded.
+        """
+        if not self._session_active:
+            raise BrowserSessionError("No active session to recycle")
+
+        if self.page:
+            await self.page.close()
+        if self.context:
+            await self.context.close()
+            self._forget_frames()
+
+        await self._open_page(self._get_context_options())
+        self._title = None
+        logger.info("♻️ Browser context recycled")
+
+    def _get_context_options(self) -> dict[str, Any]:
+        """Get options for new browser contexts."""
+        return {
+            "viewport": {"width": self.config.viewport_width, "height": self.config.viewport_height},
+            "user_agent": self._get_user_agent(),
+            "extra_http_headers": _EXTRA_HTTP_HEADERS,
+            "ignore_https_errors": True,  # Better error handling
+            "java_script_enabled": True,
+        }
+
+    async def _open_page(self, context_options: dict[str, Any]) -> None:
+        """Create a context and page on the current browser."""
+        self.context = await self.browser.new_context(**context_options)
+
+        # Block requests on every page of the context, including popups and target=_blank pages
+        self.context.on("page", self._handle_new_page)
+
+        # Create page with optimized settings
+        self.page = await self.new_page()
+
+        # Set up page-level optimizations
+        await self._setup_page_optimizations()
+
+    async def new_page(self) -> Page:
+        """
+        Open a page in the session's context with request blocking and the default timeout applied.
+
+        Returns:
+            New Playwright page
+        """
+        page = await self.context.new_page()
+        page.set_default_timeout(self.config.timeout)
+
+        # The context's page handler has already started the blocker; wait until it is in place
+        blocker = self._page_blockers.get(page)
+        if blocker is not None:
+            await blocker
+        else:
+            await self._block_requests(page)
+        return page
+
     def _get_browser_args(self) -> list[str]:
         """Get optimized browser launch arguments."""
-        base_args = [
-            "--disable-blink-features=AutomationControlled",
-            "--disable-web-security",
-            "--disable-features=VizDisplayCompositor",
-            "--disable-background-networking",
-            "--disable-background-timer-throttling",
-            "--disable-renderer-backgrounding",
-            "--disable-backgrounding-occluded-windows",
-            "--disable-client-side-phishing-detection",
-            "--disable-crash-reporter",
-            "--disable-oopr-debug-crash-dump",
-            "--no-crash-upload",
-            "--disable-gpu",
-            "--disable-extensions",
-            "--disable-low-res-tiling",
-            "--log-level=3",
-            "--silent",
-        ]
-
-        if not self.config.headless:
-            base_args.extend(
-                [
-                    "--new-window",
-                    "--start-maximized",
-                ]
-            )
-
-        return base_args
+        extra_args = _HEADLESS_ARGS if self.config.headless else _HEADED_ARGS
+        return list(_COMMON_BROWSER_ARGS + extra_args)
 
     def _get_user_agent(self) -> str:
         """Get realistic user agent string."""
-        return (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
+        return _USER_AGENT
 
     async def _setup_page_optimizations(self) -> None:
         """Set up page-level optimizations for better performance."""
         if not self.page:
             return
 
-        # Block unnecessary resources for faster loading
-        await self.page.route("**/*", self._route_handler)
-
-        # Set up error handling
-        self.page.on("console", self._handle_console_message)
-        self.page.on("pageerror", self._handle_page_error)
-
-    async def _route_handler(self, route, request):
-        """Handle route requests to block unnecessary resources."""
-        # Block ads, analytics, and other non-essential resources
-        blocked_types = {"image", "media", "font"} if self.config.headless else {"font"}
-        blocked_domains = {
-            "google-analytics.com",
-            "googletagmanager.com",
-            "facebook.com/tr",
-            "doubleclick.net",
-            "googlesyndication.com",
-        }
+        # Page errors are only ever logged at debug level; without a listener Playwright does not
+        # forward console events from the browser at all, so noisy pages cost nothing otherwise
+        if logger.isEnabledFor(logging.DEBUG):
+            self.page.on("console", self._handle_console_message)
+            self.page.on("pageerror", self._handle_page_error)
 
-        request_url = request.url.lower()
+        # Invalidate the cached title when the main document changes
+        self.page.on("framenavigated", self._handle_frame_navigated)
+        self.page.on("domcontentloaded", self._invalidate_title)
+        self.page.on("load", self._invalidate_title)
 
-        # Block based on resource type or domain
-        if request.resource_type in blocked_types or any(domain in request_url for domain in blocked_domains):
-            await route.abort()
-        else:
-            await route.continue_()
+    def _handle_new_page(self, page: Page) -> None:
+        """Start blocking requests on a page as soon as the context opens it."""
+        self._page_blockers[page] = asyncio.ensure_future(self._block_requests(page))
+        page.once("close", lambda _: self._page_blockers.pop(page, None))
+
+    async def _block_requests(self, page: Page) -> None:
+        """
+        Block unnecessary resources for a page through the DevTools Fetch domain.
+
+        Unlike a Playwright route, which sends every request through Python, the browser only
+        pauses requests matching the blocked types and hosts, so everything else loads without
+        a round-trip and the HTTP cache stays enabled. The page's session also covers its
+        in-process iframes; out-of-process ones get their own session once they navigate.
+        """
+        try:
+            await self._enable_blocking(await self.context.new_cdp_session(page))
+        except Exception as e:
+            logger.warning(f"⚠️ Could not enable request blocking: {e}")
+            return
+
+        page.on("framenavigated", self._handle_child_frame)
+        page.on("framedetached", self._handle_frame_detached)
+
+    def _handle_child_frame(self, frame: Frame) -> None:
+        """Make sure a navigated iframe's requests are blocked if it runs in its own process."""
+        if frame.parent_frame is None:
+            return
+
+        # An iframe only moves to another process when it changes site, so a navigation within the
+        # origin it was last checked at keeps whatever blocking it already has
+        origin = _origin(frame.url)
+        if self._frame_origins.get(frame) == origin:
+            return
+        self._frame_origins[frame] = origin
+
+        task = asyncio.ensure_future(self._block_frame_requests(frame))
+        self._frame_tasks.add(task)
+        task.add_done_callback(self._frame_tasks.discard)
+
+    def _handle_frame_detached(self, frame: Frame) -> None:
+        """Forget a removed iframe."""
+        self._frame_blockers.pop(frame, None)
+        self._frame_origins.pop(frame, None)
+
+    def _forget_frames(self) -> None:
+        """Forget every iframe and cancel checks still running, e.g. when the context goes away."""
+        for task in self._frame_tasks:
+            task.cancel()
+        self._frame_tasks.clear()
+        self._frame_blockers.clear()
+        self._frame_origins.clear()
+
+    async def _block_frame_requests(self, frame: Frame) -> None:
+        """Block requests of an out-of-process iframe, which its page's DevTools session does not see."""
+        cdp = self._frame_blockers.get(frame)
+        if cdp is not None:
+            try:
+                # Still attached when the iframe stayed in the same process; enabling again is a no-op
+                await cdp.send("Fetch.enable", {"patterns": self._blocked_patterns})
+                return
+            except Exception:
+                self._frame_blockers.pop(frame, None)
+
+        try:
+            cdp = await self.context.new_cdp_session(frame)
+        except Exception:
+            return  # In-process iframes share their page's session, which already blocks their requests
+
+        try:
+            await self._enable_blocking(cdp)
+            self._frame_blockers[frame] = cdp
+        except Exception as e:
+            logger.debug(f"Could not block iframe requests: {e}")
+
+    async def _enable_blocking(self, cdp: CDPSession) -> None:
+        """Fail requests matching the blocked patterns inside the browser for a DevTools session's target."""
+
+        async def _fail_request(event: dict[str, Any]) -> None:
+            try:
+                await cdp.send("Fetch.failRequest", {"requestId": event["requestId"], "errorReason": "BlockedByClient"})
+            except Exception as e:
+                logger.debug(f"Could not block request: {e}")
+
+        cdp.on("Fetch.requestPaused", _fail_request)
+        await cdp.send("Fetch.enable", {"patterns": self._blocked_patterns})
 
     def _handle_console_message(self, msg) -> None:
         """Handle console messages from the page."""
@@ -252,8 +445,17 @@ class BrowserSession:
         """Handle page errors."""
         logger.debug(f"Page error: {error}")
 
+    def _handle_frame_navigated(self, frame) -> None:
+        """Handle frame navigations."""
+        if self.page and frame is self.page.main_frame:
+            self._title = None
+
+    def _invalidate_title(self, _page=None) -> None:
+        """Drop the cached page title."""
+        self._title = None
+
     async def _check_network_idle(self) -> bool:
-        """Check if network is idle (no pending requests)."""
+        """Check if network is idle (no pending requests); returns at once if the page already went idle."""
         try:
             await self.page.wait_for_load_state("networkidle", timeout=1000)
             return True
@@ -261,33 +463,51 @@ class BrowserSession:
             return False
 
     async def _check_page_ready(self) -> bool:
-        """Check if page is fully loaded and ready."""
+        """Check if the page's DOM has been parsed, reading the current state instead of waiting for it."""
         try:
-            await self.page.wait_for_load_state("domcontentloaded", timeout=1000)
-            return True
+            return await self.page.evaluate("document.readyState !== 'loading'")
         except Exception:
             return False
 
     async def _cleanup_failed_start(self) -> None:
-        """Cleanup resources after failed session start."""
-        try:
-            if self.page:
-                await self.page.close()
+        """Cleanup resources after failed session start, giving up after a bounded time."""
+
+        async def _teardown() -> None:
+            # Closing the context also closes its page; the browser is released even if that fails
             if self.context:
-                await self.context.close()
+                try:
+                    await self.context.close()
+                except Exception as e:
+                    logger.debug(f"Error closing context after failed start: {e}")
             if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
+                await self._release_browser()
+
+        try:
+            await asyncio.wait_for(_teardown(), timeout=_CLEANUP_TIMEOUT)
         except Exception:
             pass  # Ignore cleanup errors
         finally:
             self._force_cleanup()
 
+    async def _release_browser(self) -> None:
+        """Return the browser to the pool, which shuts down once no session holds one."""
+        await BrowserPool.release(self.browser, self.config)
+
     def _force_cleanup(self) -> None:
         """Force cleanup of all resources."""
         self.page = None
         self.context = None
         self.browser = None
-        self.playwright = None
         self._session_active = False
+        self._title = None
+        self._page_blockers.clear()
+        self._forget_frames()
+
+    async def __aenter__(self):
+        """Async context manager entry; a failed start cleans up after itself before raising."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit; closing an inactive session is a no-op."""
+        await self.close()
@@ -2,6 +2,7 @@
 Browser Utilities - Helper functions for element finding and common operations.
 """
 
+import itertools
 import logging
 from typing import Any
 
@@ -9,21 +10,214 @@ from playwright.async_api import Locator, Page
 
 logger = logging.getLogger(__name__)
 
+# Attribute used to tag the element found by _FIND_ELEMENT_JS so a locator can target it directly
+_TARGET_ATTRIBUTE = "data-swarm-target"
+_target_ids = itertools.count()
+
+# Finds the best element for a text/label in a single page.evaluate() call and tags it.
+# kind is "clickable", "input" or "select"; returns the tag value or null when nothing matches.
+# With exact and partialFallback both set, partial matches are used only when nothing matches
+# exactly, so both passes share one scan. Tags are a space-separated list so concurrent lookups
+# do not clobber each other; only tags more than 64 lookups old are pruned.
+# Exact matches are case-sensitive and partial ones are not, like Playwright's text locators.
+_FIND_ELEMENT_JS = """
+([kind, text, exact, partialFallback, attribute, tag, seq]) => {
+    const normalize = (value) => (value || "").replace(/\\s+/g, " ").trim();
+    const fold = (value) => normalize(value).toLowerCase();
+    const target = normalize(text);
+    const folded = target.toLowerCase();
+    if (!target) return null;
+
+    // Exact matches go to exactMatches, and partial ones (in exact mode, only with
+    // partialFallback) to partialMatches
+    const collect = (el, exactMatches, partialMatches, ...values) => {
+        const normalized = values.map(normalize);
+        if (exact && normalized.some((value) => value === target)) exactMatches.push(el);
+        else if ((!exact || partialFallback) && normalized.some((value) => value.toLowerCase().includes(folded))) {
+            partialMatches.push(el);
+        }
+    };
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== "hidden";
+    };
+
+    let candidates = [];
+    if (kind === "clickable") {
+        const clickExact = [], clickPartial = [], textExact = [], textPartial = [];
+        const clickable = "button, a, [role='button'], [role='link'], input[type='button'], " +
+            "input[type='submit'], input[type='reset'], summary, [onclick]";
+        for (const el of document.querySelectorAll(clickable)) {
+            const [label, value] = [el.getAttribute("aria-label"), el.getAttribute("value")];
+            collect(el, clickExact, clickPartial, el.innerText, label, value);
+        }
+        if (!clickExact.length && (exact || !clickPartial.length) && document.body) {
+            // Generic text match: the closest element around a matching text node
+            const skipped = new Set(["SCRIPT", "STYLE", "NOSCRIPT", "TEMPLATE"]);
+            const seen = new Set();
+            const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+            for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+                // Only read the parent's whole text when this node contains the target or is a piece
+                // of it; whitespace and unrelated text nodes cannot make their parent match
+                const data = fold(node.data);
+                if (!data || !(data.includes(folded) || folded.includes(data))) continue;
+                const el = node.parentElement;
+                if (el && !seen.has(el) && !skipped.has(el.tagName)) {
+                    seen.add(el);
+                    collect(el, textExact, textPartial, el.textContent);
+                }
+            }
+        }
+        // Exact before partial, clickable elements before generic text
+        candidates = [clickExact, textExact, clickPartial, textPartial].find((found) => found.length) || [];
+    } else {
+        const fields = kind === "select" ? "select" : "input, textarea";
+        for (const label of document.querySelectorAll("label")) {
+            if (fold(label.innerText).includes(folded)) {
+                const control = label.control || label.querySelector(fields);
+                if (control && control.matches(fields)) candidates.push(control);
+            }
+        }
+        for (const el of document.querySelectorAll(fields)) {
+            if (
+                fold(el.getAttribute("aria-label")).includes(folded) ||
+                fold(el.getAttribute("placeholder")).includes(folded) ||
+                (el.getAttribute("name") || "").includes(text)
+            ) {
+                candidates.push(el);
+            }
+        }
+    }
+
+    const best = candidates.find(isVisible) || candidates[0];
+    if (!best) return null;
+
+    for (const el of document.querySelectorAll(`[${attribute}]`)) {
+        const kept = el.getAttribute(attribute).split(" ").filter((t) => t && Number(t.split("-").pop()) > seq - 64);
+        if (kept.length) el.setAttribute(attribute, kept.join(" "));
+        else el.removeAttribute(attribute);
+    }
+    best.setAttribute(attribute, `${best.getAttribute(attribute) || ""} ${tag}`.trim());
+    return tag;
+}
+"""
+
+# Resolves true once the element is visible and enabled, or false after timeout milliseconds.
+# Polls with setTimeout rather than requestAnimationFrame, which stops in background tabs.
+_WAIT_CLICKABLE_JS = """
+(el, timeout) => new Promise((resolve) => {
+    const deadline = performance.now() + timeout;
+    const check = () => {
+        const rect = el.getBoundingClientRect();
+        const visible = rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== "hidden";
+        const enabled = !el.matches(":disabled") && !el.closest("[aria-disabled='true']");
+        if (visible && enabled) resolve(true);
+        else if (performance.now() >= deadline) resolve(false);
+        else setTimeout(check, 50);
+    };
+    check();
+})
+"""
+
+# Collects the interactive elements summary in a single page.evaluate() call
+_PAGE_ELEMENTS_JS = """
+() => {
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== "hidden";
+    };
+    const isEnabled = (el) => !el.matches(":disabled") && el.getAttribute("aria-disabled") !== "true";
+    const text = (el) => (el.innerText || "").trim();
+    const labelFor = (el) => {
+        if (!el.id) return "";
+        const label = document.querySelector(`label[for="${CSS.escape(el.id)}"]`);
+        return label ? label.innerText : "";
+    };
+
+    const buttons = [];
+    document.querySelectorAll("button, [role='button']").forEach((el, index) => {
+        const value = text(el);
+        if (value) {
+            buttons.push({ index, text: value.slice(0, 100), visible: isVisible(el), enabled: isEnabled(el) });
+        }
+    });
+
+    const inputs = [];
+    document.querySelectorAll("input, textarea").forEach((el, index) => {
+        inputs.push({
+            index,
+            type: el.getAttribute("type") || "text",
+            label: labelFor(el).slice(0, 50),
+            placeholder: (el.getAttribute("placeholder") || "").slice(0, 50),
+            name: (el.getAttribute("name") || "").slice(0, 50),
+            visible: isVisible(el),
+            enabled: isEnabled(el),
+        });
+    });
+
+    const links = [];
+    document.querySelectorAll("a[href], area[href], [role='link']").forEach((el, index) => {
+        const value = text(el);
+        if (value) {
+            links.push({
+                index,
+                text: value.slice(0, 100),
+                href: (el.getAttribute("href") || "").slice(0, 100),
+                visible: isVisible(el),
+            });
+        }
+    });
+
+    const selects = [];
+    document.querySelectorAll("select").forEach((el, index) => {
+        const options = [];
+        for (const option of el.querySelectorAll("option")) {
+            const value = text(option);
+            if (value) {
+                options.push({ text: value.slice(0, 50), value: (option.getAttribute("value") || "").slice(0, 50) });
+            }
+            if (options.length >= 10) break;
+        }
+        selects.push({
+            index,
+            name: (el.getAttribute("name") || "").slice(0, 50),
+            label: labelFor(el).slice(0, 50),
+            options,
+            visible: isVisible(el),
+            enabled: isEnabled(el),
+        });
+    });
+
+    return { buttons, inputs, links, selects };
+}
+"""
+
+
+def _css_string(value: str) -> str:
+    """Quote a value for use in a CSS attribute or :has-text() selector."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
 
 class BrowserUtils:
     """Utility functions for browser operations and element finding."""
 
+    __slots__ = ("page",)
+
     def __init__(self, page: Page):
         """Initialize utils with page reference."""
         self.page = page
 
-    async def find_element_by_text(self, text: str, exact: bool = True) -> Locator | None:
+    async def find_element_by_text(
+        self, text: str, exact: bool = True, partial_fallback: bool = False
+    ) -> Locator | None:
         """
         Find element by text with multiple strategies.
 
         Args:
             text: Text to search for
             exact: Whether to match exact text
+            partial_fallback: With exact, fall back to a partial match when nothing matches exactly
 
         Returns:
             Locator if found, None otherwise
@@ -31,26 +225,29 @@ class BrowserUtils:
         if not self.page:
             return None
 
+        locator = await self._probe_element("clickable", text, exact, partial_fallback)
+        if locator:
+            logger.debug(f"Found element with text '{text}' in a single page lookup")
+            return locator
+
+        # Fall back to Playwright's role/text engines (accessible names, shadow DOM): button role,
+        # link role, generic text and text selector, resolved as one union query
         strategies = [
-            # Strategy 1: Button role
-            lambda: self.page.get_by_role("button", name=text, exact=exact),
-            # Strategy 2: Link role
-            lambda: self.page.get_by_role("link", name=text, exact=exact),
-            # Strategy 3: Generic text
-            lambda: self.page.get_by_text(text, exact=exact),
-            # Strategy 4: Text selector
-            lambda: self.page.locator(f"text={text}"),
+            self.page.get_by_role("button", name=text, exact=exact)
+            .or_(self.page.get_by_role("link", name=text, exact=exact))
+            .or_(self.page.get_by_text(text, exact=exact))
+            .or_(self.page.locator(f"text={text}"))
         ]
+        if exact and partial_fallback:
+            strategies.append(self.page.get_by_text(text))
 
-        for strategy in strategies:
+        for locator in strategies:
             try:
-                locator = strategy()
                 if await locator.count() > 0:
                     logger.debug(f"Found element with text '{text}' using strategy")
                     return locator.first
             except Exception as e:
                 logger.debug(f"Strategy failed for text '{text}': {e}")
-                continue
 
         return None
 
@@ -67,28 +264,32 @@ class BrowserUtils:
         if not self.page:
             return None
 
-        strategies = [
-            # Strategy 1: Direct label association
-            lambda: self.page.get_by_label(label),
-            # Strategy 2: Placeholder text
-            lambda: self.page.get_by_placeholder(label),
-            # Strategy 3: Label has-text with input
-            lambda: self.page.locator(f"label:has-text('{label}') >> input, label:has-text('{label}') >> textarea"),
-            # Strategy 4: Name attribute contains label
-            lambda: self.page.locator(f"input[name*='{label}'], textarea[name*='{label}']"),
-            # Strategy 5: Placeholder contains label
-            lambda: self.page.locator(f"input[placeholder*='{label}'], textarea[placeholder*='{label}']"),
-        ]
+        locator = await self._probe_element("input", label)
+        if locator:
+            logger.debug(f"Found input with label '{label}' in a single page lookup")
+            return locator
+
+        # Fall back to Playwright's label/placeholder engines (accessible names, shadow DOM): label
+        # association, placeholder, and label has-text/name/placeholder selectors, as one union query
+        quoted = _css_string(label)
+        locator = (
+            self.page.get_by_label(label)
+            .or_(self.page.get_by_placeholder(label))
+            .or_(
+                self.page.locator(
+                    f"label:has-text({quoted}) input, label:has-text({quoted}) textarea, "
+                    f"input[name*={quoted}], textarea[name*={quoted}], "
+                    f"input[placeholder*={quoted}], textarea[placeholder*={quoted}]"
+                )
+            )
+        )
 
-        for strategy in strategies:
-            try:
-                locator = strategy()
-                if await locator.count() > 0:
-                    logger.debug(f"Found input with label '{label}' using strategy")
-                    return locator.first
-            except Exception as e:
-                logger.debug(f"Strategy failed for label '{label}': {e}")
-                continue
+        try:
+            if await locator.count() > 0:
+                logger.debug(f"Found input with label '{label}' using strategy")
+                return locator.first
+        except Exception as e:
+            logger.debug(f"Strategy failed for label '{label}': {e}")
 
         return None
 
@@ -105,29 +306,58 @@ class BrowserUtils:
         if not self.page:
             return None
 
-        strategies = [
-            # Strategy 1: Direct label association
-            lambda: self.page.get_by_label(label),
-            # Strategy 2: Combobox role
-            lambda: self.page.get_by_role("combobox", name=label),
-            # Strategy 3: Name attribute
-            lambda: self.page.locator(f"select[name*='{label}']"),
-            # Strategy 4: Label has-text with select
-            lambda: self.page.locator(f"label:has-text('{label}') >> select"),
-        ]
+        locator = await self._probe_element("select", label)
+        if locator:
+            logger.debug(f"Found select with label '{label}' in a single page lookup")
+            return locator
 
-        for strategy in strategies:
-            try:
-                locator = strategy()
-                if await locator.count() > 0:
-                    logger.debug(f"Found select with label '{label}' using strategy")
-                    return locator.first
-            except Exception as e:
-                logger.debug(f"Strategy failed for select '{label}': {e}")
-                continue
+        # Fall back to Playwright's label/role engines (accessible names, shadow DOM): label association,
+        # combobox role, and name attribute or label has-text selectors, as one union query
+        quoted = _css_string(label)
+        locator = (
+            self.page.get_by_label(label)
+            .or_(self.page.get_by_role("combobox", name=label))
+            .or_(self.page.locator(f"select[name*={quoted}], label:has-text({quoted}) select"))
+        )
+
+        try:
+            if await locator.count() > 0:
+                logger.debug(f"Found select with label '{label}' using strategy")
+                return locator.first
+        except Exception as e:
+            logger.debug(f"Strategy failed for select '{label}': {e}")
 
         return None
 
+    async def _probe_element(
+        self, kind: str, text: str, exact: bool = False, partial_fallback: bool = False
+    ) -> Locator | None:
+        """
+        Find and tag the best matching element with one page.evaluate() round-trip.
+
+        Args:
+            kind: "clickable", "input" or "select"
+            text: Element text, or label text for form fields
+            exact: Whether to match exact text (clickable elements only)
+            partial_fallback: With exact, accept a partial match when nothing matches exactly
+
+        Returns:
+            Locator targeting the tagged element, or None if nothing matched
+        """
+        seq = next(_target_ids)
+        tag = f"{kind}-{seq}"
+        try:
+            found = await self.page.evaluate(
+                _FIND_ELEMENT_JS, [kind, text, exact, partial_fallback, _TARGET_ATTRIBUTE, tag, seq]
+            )
+        except Exception as e:
+            logger.debug(f"Page lookup failed for '{text}': {e}")
+            return None
+
+        if not found:
+            return None
+        return self.page.locator(f'[{_TARGET_ATTRIBUTE}~="{tag}"]')
+
     async def wait_for_element_visible(self, locator: Locator, timeout: int = 5000) -> bool:
         """
         Wait for element to be visible.
@@ -157,11 +387,8 @@ class BrowserUtils:
             True if element became clickable, False otherwise
         """
         try:
-            # Check if element is visible and enabled
-            await locator.wait_for(state="visible", timeout=timeout)
-            if await locator.is_enabled():
-                return True
-            return False
+            # Poll visibility and enablement together in the page instead of two separate round-trips
+            return await locator.evaluate(_WAIT_CLICKABLE_JS, timeout, timeout=timeout)
         except Exception:
             return False
 
@@ -254,116 +481,8 @@ class BrowserUtils:
         elements = {"buttons": [], "inputs": [], "links": [], "selects": []}
 
         try:
-            # Get buttons
-            buttons = await self.page.get_by_role("button").all()
-            for i, button in enumerate(buttons):
-                try:
-                    text = await button.inner_text()
-                    if text.strip():
-                        elements["buttons"].append(
-                            {
-                                "index": i,
-                                "text": text.strip()[:100],  # Limit text length
-                                "visible": await button.is_visible(),
-                                "enabled": await button.is_enabled(),
-                            }
-                        )
-                except Exception:
-                    continue
-
-            # Get input fields
-            inputs = await self.page.locator("input, textarea").all()
-            for i, input_elem in enumerate(inputs):
-                try:
-                    input_type = await input_elem.get_attribute("type") or "text"
-                    placeholder = await input_elem.get_attribute("placeholder") or ""
-                    name = await input_elem.get_attribute("name") or ""
-
-                    # Try to find associated label
-                    label = ""
-                    try:
-                        input_id = await input_elem.get_attribute("id")
-                        if input_id:
-                            label_elem = self.page.locator(f"label[for='{input_id}']")
-                            if await label_elem.count() > 0:
-                                label = await label_elem.inner_text()
-                    except Exception:
-                        pass
-
-                    elements["inputs"].append(
-                        {
-                            "index": i,
-                            "type": input_type,
-                            "label": label[:50] if label else "",
-                            "placeholder": placeholder[:50] if placeholder else "",
-                            "name": name[:50] if name else "",
-                            "visible": await input_elem.is_visible(),
-                            "enabled": await input_elem.is_enabled(),
-                        }
-                    )
-                except Exception:
-                    continue
-
-            # Get links
-            links = await self.page.get_by_role("link").all()
-            for i, link in enumerate(links):
-                try:
-                    text = await link.inner_text()
-                    href = await link.get_attribute("href") or ""
-                    if text.strip():
-                        elements["links"].append(
-                            {
-                                "index": i,
-                                "text": text.strip()[:100],
-                                "href": href[:100] if href else "",
-                                "visible": await link.is_visible(),
-                            }
-                        )
-                except Exception:
-                    continue
-
-            # Get select elements
-            selects = await self.page.locator("select").all()
-            for i, select in enumerate(selects):
-                try:
-                    name = await select.get_attribute("name") or ""
-
-                    # Try to find associated label
-                    label = ""
-                    try:
-                        select_id = await select.get_attribute("id")
-                        if select_id:
-                            label_elem = self.page.locator(f"label[for='{select_id}']")
-                            if await label_elem.count() > 0:
-                                label = await label_elem.inner_text()
-                    except Exception:
-                        pass
-
-                    # Get options
-                    options = []
-                    try:
-                        option_elements = await select.locator("option").all()
-                        for option in option_elements:
-                            option_text = await option.inner_text()
-                            option_value = await option.get_attribute("value") or ""
-                            if option_text.strip():
-                                options.append({"text": option_text.strip()[:50], "value": option_value[:50]})
-                    except Exception:
-                        pass
-
-                    elements["selects"].append(
-                        {
-                            "index": i,
-                            "name": name[:50] if name else "",
-                            "label": label[:50] if label else "",
-                            "options": options[:10],  # Limit options
-                            "visible": await select.is_visible(),
-                            "enabled": await select.is_enabled(),
-                        }
-                    )
-                except Exception:
-                    continue
-
+            # Walk the DOM once in the page instead of one round-trip per element attribute
+            elements.update(await self.page.evaluate(_PAGE_ELEMENTS_JS))
         except Exception as e:
             logger.error(f"Failed to get page elements summary: {e}")
 